@@ -6,37 +6,502 @@ Accepts natural language commands and provides intelligent analysis
 """
 
 import asyncio
+import concurrent.futures
+import hashlib
 import json
 import re
 import os
+import pickle
 import sys
 import socket
+import textwrap
+import threading
+from collections import deque, OrderedDict
 from datetime import datetime
-from langchain_openai import ChatOpenAI
-from langchain_ollama import ChatOllama
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
-import urllib3
-import yaml
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from dataclasses import dataclass
-import paramiko
-import requests
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.prompt import Prompt, Confirm
 from rich.live import Live
-from rich.spinner import Spinner
 import argparse
 import time
 
-from dotenv import load_dotenv
-load_dotenv()
-
 # Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# CLI prompt detection (e.g. "switch#" or "switch>"), compiled once against
+# raw bytes so the recv loop can detect prompts without decoding first
+_PROMPT_RE = re.compile(rb'[>#]\s*$')
+
+# Comment marker interleaved between pipelined commands; the shell echoes it
+# back, letting us split the combined output into per-command sections
+_CMD_MARKER = "! ---CMD:{}---"
+_CMD_MARKER_RE = re.compile(r'!\s*---CMD:(\d+)---[^\n]*\n?')
+
+# Common IOS to Nexus command translations with strict blocking
+_IOS_TO_NEXUS = {
+    "show bgp summary": "show bgp l2vpn evpn summary",
+    "show bgp neighbors": "show bgp l2vpn evpn neighbors",
+    "show ip bgp summary": "show bgp ipv4 unicast summary",
+    "show ip bgp neighbors": "show bgp ipv4 unicast neighbors",
+    "show processes cpu": "show system resources",
+    "show processes": "show system resources",
+    "show interface e1/": "show interface ethernet1/",
+    "show int e1/": "show interface ethernet1/",
+}
+
+try:
+    # Optional guaranteed-linear DFA engine (google-re2) for the multi-pattern
+    # IOS scan; the stdlib engine behaves identically for these literal
+    # alternations and remains the fallback
+    import re2 as _scan_engine
+except ImportError:
+    _scan_engine = re
+
+# Single alternation covering every IOS pattern, longest first so e.g.
+# "show processes cpu" wins over "show processes"; one C-level regex scan
+# per command replaces the per-pattern Python substring loops
+_IOS_RE = _scan_engine.compile(
+    '|'.join(re.escape(k) for k in sorted(_IOS_TO_NEXUS, key=len, reverse=True)),
+    _scan_engine.IGNORECASE
+)
+
+# Keywords marking a command as configuration-mode in NexusClient, compiled
+# longest-first into one alternation so "no shutdown" wins over "shutdown"
+# and a single C-level scan replaces the per-keyword substring loop
+_CONFIG_KEYWORDS = (
+    'configure terminal', 'interface ethernet', 'interface vlan', 'router bgp',
+    'vlan ', 'snmp-server', 'feature ', 'vpc ', 'no shutdown', 'shutdown',
+    'description ', 'ip address', 'switchport', 'neighbor ', 'address-family',
+)
+_CONFIG_KEYWORDS_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_CONFIG_KEYWORDS, key=len, reverse=True))
+)
+
+# Sub-commands that belong inside an interface configuration block, compiled
+# longest-first into one alternation for a single scan per command
+_IFACE_SUB_KEYWORDS = (
+    'description', 'switchport', 'no shutdown', 'shutdown',
+    'ip address', 'spanning-tree', 'mtu', 'speed', 'duplex',
+)
+_IFACE_SUB_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_IFACE_SUB_KEYWORDS, key=len, reverse=True))
+)
+
+# Command classes for the grouping state machine in group_interface_commands
+_CMD_SHOW = 0
+_CMD_IFACE = 1
+_CMD_IFACE_SUB = 2
+_CMD_CONF_TERM = 3
+_CMD_OTHER = 4
+
+def _classify(cmd_lower: str) -> int:
+    """Classify one lower-cased command for interface grouping"""
+    if cmd_lower.startswith(('show ', 'display ')):
+        return _CMD_SHOW
+    if cmd_lower.startswith('interface '):
+        return _CMD_IFACE
+    if cmd_lower == 'configure terminal':
+        return _CMD_CONF_TERM
+    if _IFACE_SUB_RE.search(cmd_lower):
+        return _CMD_IFACE_SUB
+    return _CMD_OTHER
+
+# Keywords that mark a command as configuration-changing for the safety
+# confirmation prompt (broader than _CONFIG_KEYWORDS, which only decides
+# whether the shell must enter config mode)
+_CFG_COMMAND_KEYWORDS = [
+    'configure terminal',
+    'interface ethernet',  # More specific to avoid false positives
+    'interface vlan',
+    'interface loopback',
+    'interface port-channel',
+    'router bgp',
+    'vlan ',
+    'snmp-server',
+    'feature ',
+    'vpc ',
+    'no shutdown',
+    'shutdown',
+    'description ',
+    'ip address',
+    'switchport',
+    'neighbor ',
+    'address-family',
+    'route-map',
+    'access-list',
+    'ip route',
+    'hostname',
+    'username',
+    'enable secret',
+    'line vty',
+    'copy running',
+    'write memory',
+    'default interface', # delete all the configuration under an interface
+    'no ',  # Any 'no' command is typically configuration
+]
+_CFG_COMMAND_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_CFG_COMMAND_KEYWORDS, key=len, reverse=True))
+)
+
+# Device error strings that mark a command's output as a failure
+_FAILURE_INDICATORS = [
+    "Invalid command",
+    "% Invalid",
+    "Syntax error",
+    "Command not found",
+    "% Ambiguous command",
+    "Permission denied",
+    "Authentication failed"
+]
+_RE_FAIL = re.compile(
+    '|'.join(re.escape(k) for k in sorted(_FAILURE_INDICATORS, key=len, reverse=True))
+)
+
+# Keywords highlighted in red in the configuration warning listing
+_RE_CONFIG_HILITE = re.compile('|'.join(
+    sorted(('configure', 'interface', 'router', 'vlan', 'snmp-server'), key=len, reverse=True)
+))
+
+# Read-only command prefixes that can never be configuration
+_READONLY_PREFIXES = ('show', 'display', 'ping', 'traceroute', 'telnet', 'ssh')
+
+# show vlan table row (ID, Name, Status, Ports) plus any indented
+# continuation lines carrying the rest of the port list
+_RE_VLAN_MULTI = re.compile(
+    # [^\S\n] = whitespace except newline: the gap before the ports column
+    # must not cross into the next row when a VLAN has no ports
+    r"^\s*(\d+)\s+(\S+)\s+(active|suspended|act/lshut|inactive)?[^\S\n]*([^\n]*)"
+    r"((?:\n\s+Eth[^\n]*)*)",
+    re.MULTILINE
+)
+
+# Interface name as it appears in natural-language queries (e1/7, ethernet1/7)
+_RE_IFACE = re.compile(r'e\d+/\d+|ethernet\d+/\d+')
+
+# Interface spellings seen on the wire and in queries, longest first
+_IFACE_PREFIXES = ("ethernet", "eth", "e")
+
+def _normalize_interface(name: str) -> str:
+    """Canonicalize interface spellings (e1/7, Eth1/7 -> ethernet1/7)"""
+    name = name.strip().lower()
+    for prefix in _IFACE_PREFIXES:
+        if name.startswith(prefix):
+            return "ethernet" + name[len(prefix):]
+    return name
+
+# Volatile fields masked in command output before it reaches the analyzer
+# prompt and the cache keys: timestamps and uptimes change constantly
+# without carrying operational meaning, busting caches and wasting tokens.
+# Traffic rates and counters are deliberately NOT masked - they answer
+# real questions, and when they change the cached analysis is stale.
+_CANON = (
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}T\S+'), '<TS>'),
+    (re.compile(r'\d+:\d{2}:\d{2}'), '<DUR>'),
+    (re.compile(r'\b\d+\s*(?:usecs?|msecs?|secs?|seconds?|mins?|minutes?|hrs?|hours?|days?|weeks?)\b'), '<DUR>'),
+)
+
+def _canonicalize_switch_output(cmd: str, text: str) -> str:
+    """Mask volatile fields so equal device states compare and hash equal"""
+    for pattern, replacement in _CANON:
+        text = pattern.sub(replacement, text)
+    return text.rstrip()
+
+# Exact-match analysis cache bounds
+_ANALYSIS_CACHE_MAX = 512
+_ANALYSIS_CACHE_TTL = 3600.0
+
+# Dotted-quad IP address inside a natural-language query
+_RE_IP = re.compile(r'\b\d{1,3}(?:\.\d{1,3}){3}\b')
+
+def _truncate(s: str, n: int = 500) -> str:
+    """Clamp s to n characters, marking the cut with an ellipsis"""
+    return s[:n] + "..." if len(s) > n else s
+
+def _has_dynamic_tokens(text: str) -> bool:
+    """True when the query embeds an IP or interface name
+
+    Such queries must not be served from the similarity cache: a paraphrase
+    naming a *different* interface can embed close enough to match.
+    """
+    lowered = text.lower()
+    return bool(_RE_IFACE.search(lowered) or _RE_IP.search(lowered))
+
+# On-disk cache of natural language -> validated command lists
+_CMD_CACHE_PATH = os.path.expanduser("~/.nexus-monitor/cmd_cache.json")
+_CMD_CACHE_MAX_ENTRIES = 1000
+
+# Switch inventory and its parsed cache (invalidated by YAML mtime)
+_SWITCHES_CONFIG_PATH = "config/switches.yaml"
+_SWITCHES_CACHE_PATH = os.path.expanduser("~/.nexus-monitor/switches.pkl")
+
+# Exact IOS commands blocked outright in validate_nexus_commands
+_BLOCKED_IOS_COMMANDS = frozenset(["show bgp summary", "show bgp neighbors", "show ip bgp"])
+
+# Replacements applied when a blocked IOS command is caught
+_NEXUS_REPLACEMENTS = {
+    "show bgp summary": "show bgp l2vpn evpn summary",
+    "show bgp neighbors": "show bgp l2vpn evpn neighbors",
+    "show ip bgp": "show bgp ipv4 unicast summary",
+}
+
+# Translator system prompt. Kept byte-identical across calls so provider-
+# side prompt caching (OpenAI automatic, Anthropic via cache_control) can
+# reuse the prefix; never interpolate anything into it.
+_NEXUS_SYSTEM_PROMPT = '''You are an expert Cisco Nexus network engineer. Convert natural language requests into appropriate Nexus CLI commands.
+
+CRITICAL: Use ONLY NEXUS-SPECIFIC syntax. NEVER use IOS commands!
+IMPORTANT: Return ONLY the CLI commands, one per line. Do NOT use markdown code blocks (```). Do NOT include explanatory text.
+
+IMPORTANT: For VLAN-related queries about interface assignments, use these approaches:
+- To find which VLAN an interface is assigned to: Use "show vlan brief" (shows all VLANs and their port assignments)
+- To see interface configuration: Use "show running-config interface ethernetX/X"
+- To see interface status: Use "show interface ethernetX/X"
+
+• If configuration is needed, include commands such as:
+  - configure terminal
+  - snmp-server community public ro
+  - feature <feature-name>
+  - interface ethernetX/X
+  - vlan <id>
+  - router bgp <asn>
+  - address-family l2vpn evpn
+  - no shutdown
+
+📌 Examples:
+Input: "Which VLAN is interface e1/7 assigned to?"
+Output:
+show vlan brief
+
+Input: "What VLAN is ethernet1/5 in?"
+Output:
+show vlan brief
+
+Input: "Show me the VLAN assignment for interface e1/10"
+Output:
+show vlan brief
+
+Input: "Configure SNMP v2 with community public"
+Output:
+configure terminal
+snmp-server community public ro
+
+Input: "Enable BGP on AS 65001"
+Output:
+configure terminal
+feature bgp
+router bgp 65001
+
+Input: "Create VLAN 100 named USERS"
+Output:
+configure terminal
+vlan 100
+  name USERS
+
+Input: "Configure interface e1/7 as access port and add it to vlan 100"
+Output:
+configure terminal
+interface ethernet1/7
+description "Access Port for VLAN 100"
+switchport
+switchport mode access
+switchport access vlan 100
+no shutdown
+
+Input: "Enable interface Ethernet1/1"
+Output:
+configure terminal
+interface ethernet1/1
+no shutdown
+
+Input: "Enable interface range Ethernet1/1-7"
+Output:
+configure terminal
+interface ethernet1/1-7
+no shutdown
+
+Input: "Disable interface range Ethernet1/1-7"
+Output:
+configure terminal
+interface ethernet1/1-7
+shutdown
+
+Input: "Default interface Ethernet1/1"
+Output:
+configure terminal
+default interface ethernet1/1
+
+FORBIDDEN IOS Commands (DO NOT USE):
+- show bgp summary (IOS) ❌
+- show bgp neighbors (IOS) ❌
+- show ip bgp (IOS) ❌
+- show processes (IOS) ❌
+- show vlan interface (IOS style) ❌
+
+REQUIRED NEXUS Commands:
+
+BGP Commands:
+- show bgp l2vpn evpn summary (for EVPN neighbors)
+- show bgp l2vpn evpn neighbors (for EVPN neighbor details)
+- show bgp ipv4 unicast summary (for IPv4 BGP)
+- show bgp ipv4 unicast neighbors (for IPv4 BGP neighbors)
+- show bgp ipv6 unicast summary (for IPv6 BGP)
+- show bgp process (BGP process information)
+- show bgp sessions (all BGP sessions)
+
+Interface Commands:
+- show running-config interface ethernet1/1
+- show interface
+- show interface brief
+- show ip interface brief
+- show interface ethernet1/1 (NOT e1/1)
+- show interface status
+- show interface status up
+- show interface counters errors
+
+System Commands:
+- show system resources (NOT show processes)
+- show environment
+- show version
+- show module
+
+VLAN Commands:
+- show vlan brief (shows all VLANs and their port assignments)
+- show vlan id <vlan-id>
+- show running-config vlan
+- show running-config interface ethernet1/X (to see interface VLAN config)
+
+NEVER generate these IOS commands:
+- show bgp summary
+- show bgp neighbors
+- show ip bgp
+- show processes cpu
+- show vlan interface
+
+REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks.'''
+
+# Static analysis guidance, split out of the per-call prompt so providers
+# can prefix-cache it server-side. Kept byte-identical across calls -
+# never interpolate anything into it.
+_ANALYSIS_SYSTEM_PROMPT = """You analyze output from Cisco Nexus CLI commands and provide insights based on the user's request.
+
+Provide a comprehensive analysis including:
+1. Direct answer to the user's question
+2. Key findings and observations
+3. Any issues or concerns identified
+4. Recommended next steps or actions
+5. Additional commands that might be helpful
+
+Format the response clearly with emojis and sections for better readability.
+Keep the analysis practical and actionable for network operations.
+Focus on what matters most for network health and troubleshooting.
+
+If there are any problems found, prioritize those in your analysis.
+If everything looks good, highlight the positive status clearly.
+
+IMPORTANT: If this was a query about VLAN assignment for a specific interface, make sure to directly answer which VLAN the interface is assigned to based on the show vlan brief output."""
+
+# Process-wide Console singleton; Console() probes terminal capabilities
+# on construction, so build it once and share it
+_console = None
+
+def get_console() -> Console:
+    """Return the shared Console instance, creating it on first use"""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+# Pooled asyncssh connections for fleet-wide show commands, keyed by endpoint
+_ASYNC_SSH_POOL = {}
+
+async def _async_ssh_connect(switch):
+    """Open (and pool) an asyncssh connection to a switch"""
+    import asyncssh
+
+    key = (switch.ip, switch.ssh_port, switch.username)
+    conn = await asyncssh.connect(
+        switch.ip,
+        port=switch.ssh_port,
+        username=switch.username,
+        password=switch.password,
+        known_hosts=None,
+        connect_timeout=10
+    )
+    _ASYNC_SSH_POOL[key] = conn
+    return conn
+
+async def _exec_show_async(switch, command: str) -> str:
+    """Run one show-style command on one switch over asyncssh
+
+    Only for read-only fan-out queries: configuration mode needs the
+    persistent paramiko pty kept by NexusClient. A stale pooled connection
+    is transparently reopened once.
+    """
+    key = (switch.ip, switch.ssh_port, switch.username)
+    conn = _ASYNC_SSH_POOL.get(key)
+    if conn is None:
+        conn = await _async_ssh_connect(switch)
+
+    try:
+        result = await conn.run(command, check=False)
+    except Exception:
+        _ASYNC_SSH_POOL.pop(key, None)
+        conn = await _async_ssh_connect(switch)
+        result = await conn.run(command, check=False)
+
+    return result.stdout if isinstance(result.stdout, str) else str(result.stdout)
+
+async def _close_async_ssh_pool():
+    """Close every pooled asyncssh connection and empty the pool
+
+    Must run before the event loop is torn down: connections left open
+    when asyncio.run() exits abort mid-handshake with "connection lost"
+    and pending-task warnings.
+    """
+    for conn in _ASYNC_SSH_POOL.values():
+        try:
+            conn.close()
+            await conn.wait_closed()
+        except Exception:
+            pass
+    _ASYNC_SSH_POOL.clear()
+
+# Default-model preference, first available wins; override order without a
+# code change via NEXUS_MODEL_PRIORITY (comma-separated model names)
+_MODEL_PRIORITY = (
+    "claude-sonnet-4-20250514",
+    "claude-3-5-sonnet-20241022",
+    "gpt-4o-mini",
+    "llama3.3",
+)
+
+# Ollama probe result, cached for the process lifetime
+_ollama_available = None
+
+def _ollama_is_available() -> bool:
+    """Check whether a local Ollama server is reachable (probed at most once)
+
+    The probe blocks for up to 2 seconds when Ollama is absent, so it is
+    opt-in via NEXUS_ENABLE_OLLAMA and its result is cached process-wide.
+    """
+    global _ollama_available
+
+    if os.getenv("NEXUS_ENABLE_OLLAMA", "").lower() not in ['true', '1', 'yes', 'on']:
+        return False
+
+    if _ollama_available is None:
+        try:
+            import requests
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            response = requests.get("http://localhost:11434/api/tags", timeout=2)
+            _ollama_available = response.status_code == 200
+        except Exception:
+            _ollama_available = False  # Ollama not available
+
+    return _ollama_available
 
 @dataclass
 class NexusSwitch:
@@ -47,14 +512,86 @@ class NexusSwitch:
     api_port: int = 443
     ssh_port: int = 22
 
+class _SSHPool:
+    """Process-wide pool of authenticated SSH connections, keyed by endpoint
+
+    connect_ssh consults the pool before paying the TCP handshake, key
+    exchange and auth again, and NexusClient.close() parks its connection
+    here instead of tearing it down. Idle entries are evicted lazily after
+    idle_timeout seconds.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._pool = {}  # key -> (client, last_used)
+
+    def _evict_stale(self):
+        """Close and drop entries idle past the timeout (called under lock)"""
+        now = time.time()
+        stale = [key for key, (_, last_used) in self._pool.items()
+                 if now - last_used > self.idle_timeout]
+        for key in stale:
+            client, _ = self._pool.pop(key)
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def get(self, key):
+        """Take a live pooled connection for this endpoint, or None"""
+        with self._lock:
+            self._evict_stale()
+            entry = self._pool.pop(key, None)
+
+        if entry is None:
+            return None
+
+        client, _ = entry
+        transport = client.get_transport()
+        if transport and transport.is_active():
+            return client
+
+        try:
+            client.close()
+        except Exception:
+            pass
+        return None
+
+    def put(self, key, client):
+        """Park a connection for reuse, replacing any previous entry"""
+        with self._lock:
+            self._evict_stale()
+            previous = self._pool.get(key)
+            self._pool[key] = (client, time.time())
+
+        if previous and previous[0] is not client:
+            try:
+                previous[0].close()
+            except Exception:
+                pass
+
+_SSH_POOL = _SSHPool()
+
 class NexusClient:
     def __init__(self, switch: NexusSwitch):
         self.switch = switch
         self.ssh_client = None
+        self._shell = None
+
+    def _pool_key(self):
+        return (self.switch.ip, self.switch.ssh_port, self.switch.username)
 
     def connect_ssh(self):
-        """Establish SSH connection"""
+        """Establish SSH connection, reusing a pooled one when available"""
+        import paramiko
+
         try:
+            pooled = _SSH_POOL.get(self._pool_key())
+            if pooled is not None:
+                self.ssh_client = pooled
+                return True
+
             self.ssh_client = paramiko.SSHClient()
             self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
             self.ssh_client.connect(
@@ -62,12 +599,138 @@ class NexusClient:
                 port=self.switch.ssh_port,
                 username=self.switch.username,
                 password=self.switch.password,
-                timeout=10
+                timeout=10,
+                # CLI output compresses poorly and costs handshake CPU
+                compress=False,
+                # Nexus speaks classic ssh-rsa; skipping the sha2 variants
+                # shortens the pubkey negotiation
+                disabled_algorithms={'pubkeys': ['rsa-sha2-512', 'rsa-sha2-256']}
             )
+            # Keep the transport alive between the user's commands so the
+            # persistent shell never needs a re-handshake mid-session
+            self.ssh_client.get_transport().set_keepalive(30)
             return True
         except Exception as e:
             return False
 
+    def _shell_alive(self) -> bool:
+        """Check whether the cached shell channel is still usable"""
+        return self._shell is not None and not self._shell.closed
+
+    def _get_shell(self):
+        """Get the persistent shell channel, opening it on first use
+
+        Opening a channel pays a full SSH round trip plus the login banner
+        wait, so the channel is opened once, pagination is disabled, and the
+        channel is reused for every subsequent command until close().
+        """
+        if self._shell_alive():
+            return self._shell
+
+        shell = self.ssh_client.invoke_shell()
+        shell.settimeout(10)
+
+        # Clean login banner
+        self._drain_until_prompt(shell)
+
+        # Disable pagination once for the session
+        shell.send("terminal length 0\n")
+        self._drain_until_prompt(shell)
+
+        self._shell = shell
+        return shell
+
+    def _drain_until_prompt(self, shell, timeout: float = 10.0, until: Optional[bytes] = None) -> str:
+        """Read from the shell until the CLI prompt appears or the idle timeout expires
+
+        Polls recv_ready() instead of sleeping a fixed interval, so fast
+        responses return in milliseconds rather than after a blanket sleep.
+        Handles --More-- pagination prompts by sending a space to advance.
+
+        When pipelining several commands the prompt reappears between each
+        one; passing `until` (a marker echoed after the last command) makes
+        the drain ignore prompts seen before that marker has arrived.
+        """
+        buffer = bytearray()
+        deadline = time.time() + timeout
+        seen_until = until is None
+
+        while time.time() < deadline:
+            if not shell.recv_ready():
+                time.sleep(0.001)
+                continue
+
+            try:
+                # 64 KB reads: large show outputs arrive in a handful of recv
+                # calls instead of dozens of 4 KB round-trips
+                chunk = shell.recv(65536)
+            except socket.timeout:
+                continue
+            except Exception:
+                break
+
+            if not chunk:
+                break
+
+            buffer.extend(chunk)
+            deadline = time.time() + timeout  # reset idle timer on data
+
+            # Only search the freshly extended tail for the marker, keeping
+            # the check O(chunk) rather than O(buffer)
+            if not seen_until and until in buffer[-(len(chunk) + len(until)):]:
+                seen_until = True
+
+            # The prompt can only appear at the very end, so check a small
+            # tail window - O(1) however large the buffer grows
+            if seen_until and _PROMPT_RE.search(bytes(buffer[-16:]).rstrip()):
+                break
+            elif b"--More--" in chunk:
+                shell.send(" ")  # Spacebar to advance
+
+        # Decode the assembled output exactly once
+        return buffer.decode("utf-8", errors='ignore')
+
+    def _pipeline_commands(self, shell, commands: List[str], send_end: bool = False) -> List[str]:
+        """Send every command in one write and split the echoed output back out
+
+        Interleaves a marker comment before each command plus a final marker
+        after the last one, so the drain knows when the whole pipeline has
+        finished and an intermediate prompt cannot end the read early.
+        Returns per-command output sections, index-aligned with `commands`
+        (missing sections come back empty).
+        """
+        lines = []
+        for i, command in enumerate(commands):
+            lines.append(_CMD_MARKER.format(i))
+            lines.append(command)
+        if send_end:
+            # Exit configuration mode BEFORE the final marker: the drain
+            # stops at the prompt following that marker, so anything sent
+            # after it would linger unread on the persistent channel and
+            # desync the next command's read. The end echo lands in the
+            # last section, as the old single-buffer path returned it.
+            lines.append("end")
+        final_marker = _CMD_MARKER.format(len(commands))
+        lines.append(final_marker)
+        payload = "\n".join(lines) + "\n"
+
+        # Chunked send so large blocks respect the SSH channel window
+        while payload:
+            sent = shell.send(payload)
+            payload = payload[sent:]
+
+        output = self._drain_until_prompt(shell, until=final_marker.encode())
+
+        # split() yields [preamble, idx0, section0, idx1, section1, ...]
+        sections = [""] * len(commands)
+        parts = _CMD_MARKER_RE.split(output)
+        for j in range(1, len(parts) - 1, 2):
+            idx = int(parts[j])
+            if idx < len(commands):
+                sections[idx] = parts[j + 1]
+
+        return sections
+
     def execute_command(self, command: str) -> str:
         """Execute CLI command via SSH (supports config mode & disables pagination)"""
         if not self.ssh_client:
@@ -75,75 +738,31 @@ class NexusClient:
                 return f"SSH connection failed to {self.switch.ip}"
 
         try:
-            shell = self.ssh_client.invoke_shell()
-            shell.settimeout(10)
-            buffer = ""
-
-            # Clean login banner
-            time.sleep(1)
-            shell.recv(4096)
-
-            # Disable pagination first
-            shell.send("terminal length 0\n")
-            time.sleep(0.5)
-            shell.recv(4096)
+            shell = self._get_shell()
 
             # Determine if this is a configuration command
             command_lower = command.lower().strip()
-            is_show_command = command_lower.startswith('show ') or command_lower.startswith('display ')
-            is_config_command = not is_show_command and any(keyword in command_lower for keyword in [
-                'configure terminal', 'interface ethernet', 'interface vlan', 'router bgp',
-                'vlan ', 'snmp-server', 'feature ', 'vpc ', 'no shutdown', 'shutdown',
-                'description ', 'ip address', 'switchport', 'neighbor ', 'address-family'
-            ])
+            is_show_command = command_lower.startswith(('show ', 'display '))
+            is_config_command = not is_show_command and _CONFIG_KEYWORDS_RE.search(command_lower) is not None
 
             # Only enter config mode for actual configuration commands
             if is_config_command:
                 shell.send("configure terminal\n")
-                time.sleep(0.5)
-                shell.recv(4096)
+                self._drain_until_prompt(shell)
 
-            # Send the command
+            # Send the command and read until the prompt returns
             shell.send(command + "\n")
-            time.sleep(2)
-
-            # Read all output with improved handling
-            timeout_count = 0
-            max_timeouts = 10
-
-            while timeout_count < max_timeouts:
-                try:
-                    chunk = shell.recv(4096).decode("utf-8", errors='ignore')
-                    if chunk:
-                        buffer += chunk
-                        timeout_count = 0
-
-                        # Check if we've reached a prompt
-                        if re.search(r'[>#]\s*$', chunk.strip()):
-                            break
-                        elif "--More--" in chunk:
-                            shell.send(" ")  # Spacebar to advance
-                            time.sleep(0.2)
-                    else:
-                        timeout_count += 1
-                        time.sleep(0.1)
+            buffer = self._drain_until_prompt(shell)
 
-                except socket.timeout:
-                    timeout_count += 1
-                    time.sleep(0.1)
-                except Exception as e:
-                    break
-
-            # Exit config mode only if we entered it
+            # Exit config mode only if we entered it (channel stays open for reuse)
             if is_config_command:
                 shell.send("end\n")
-                time.sleep(0.5)
-                shell.recv(4096)
+                self._drain_until_prompt(shell)
 
-            shell.close()
             return buffer.strip()
 
         except Exception as e:
+            self._shell = None  # force a fresh channel on the next command
             return f"Command execution failed: {e}"
 
     def execute_command_block(self, commands: List[str]) -> str:
@@ -153,56 +772,175 @@ class NexusClient:
                 return f"SSH connection failed to {self.switch.ip}"
 
         try:
-            shell = self.ssh_client.invoke_shell()
-            shell.settimeout(10)
-            buffer = ""
-
-            # Clean login banner
-            time.sleep(1)
-            shell.recv(4096)
+            shell = self._get_shell()
 
-            # Disable pagination
-            shell.send("terminal length 0\n")
-            time.sleep(0.5)
-            shell.recv(4096)
+            # Pipeline the whole block: the shell queues input, so sending
+            # every command up front and draining once collapses the
+            # per-command waits into a single read
+            sections = self._pipeline_commands(shell, commands, send_end=True)
 
-            # Execute all commands in sequence
-            for command in commands:
-                shell.send(command + "\n")
-                time.sleep(1)
+            buffer = ""
+            for command, section in zip(commands, sections):
+                buffer += f"\n--- Command: {command} ---\n"
+                if section.strip():
+                    buffer += section
+                else:
+                    buffer += "[Timeout or error reading output]\n"
 
-                # Read output for this command
-                try:
-                    chunk = shell.recv(4096).decode("utf-8", errors='ignore')
-                    buffer += f"\n--- Command: {command} ---\n"
-                    buffer += chunk
-
-                    # Handle --More-- prompts
-                    while "--More--" in chunk:
-                        shell.send(" ")
-                        time.sleep(0.2)
-                        chunk = shell.recv(4096).decode("utf-8", errors='ignore')
-                        buffer += chunk
-
-                except:
-                    buffer += f"\n--- Command: {command} ---\n[Timeout or error reading output]\n"
-
-            # Exit configuration mode
-            shell.send("end\n")
-            time.sleep(0.5)
-            final_chunk = shell.recv(4096).decode("utf-8", errors='ignore')
-            buffer += final_chunk
-
-            shell.close()
             return buffer.strip()
 
         except Exception as e:
+            self._shell = None  # force a fresh channel on the next command
             return f"Command block execution failed: {e}"
 
+    def execute_command_batch(self, commands: List[str]) -> Dict[str, str]:
+        """Execute several independent commands over one shell round trip
+
+        Pipelines the whole list like execute_command_block but returns a
+        per-command output dict. Meant for show-style commands: callers
+        should route configuration commands through execute_command so the
+        config-mode enter/exit handling applies.
+        """
+        if not self.ssh_client:
+            if not self.connect_ssh():
+                failure = f"SSH connection failed to {self.switch.ip}"
+                return {command: failure for command in commands}
+
+        try:
+            shell = self._get_shell()
+            sections = self._pipeline_commands(shell, commands)
+
+            # An empty section means the marker echo went missing (drain
+            # timeout, truncated read). Omit it from the dict instead of
+            # reporting empty output as success, so the caller falls back
+            # to running that command individually.
+            outputs = {}
+            for command, section in zip(commands, sections):
+                section = section.strip()
+                if section:
+                    outputs[command] = section
+            return outputs
+
+        except Exception as e:
+            self._shell = None  # force a fresh channel on the next command
+            failure = f"Command execution failed: {e}"
+            return {command: failure for command in commands}
+
     def close(self):
-        """Close SSH connection"""
+        """Return the SSH connection to the pool (the shell channel is closed)"""
+        if self._shell:
+            self._shell.close()
+            self._shell = None
         if self.ssh_client:
-            self.ssh_client.close()
+            transport = self.ssh_client.get_transport()
+            if transport and transport.is_active():
+                _SSH_POOL.put(self._pool_key(), self.ssh_client)
+            else:
+                self.ssh_client.close()
+            self.ssh_client = None
+
+# Filler words stripped before embedding so politeness and phrasing noise
+# ("please show me the...") does not dilute similarity scores
+_FILLER_WORDS = frozenset((
+    'a', 'an', 'the', 'please', 'me', 'my', 'can', 'could', 'would', 'you',
+    'i', 'want', 'to', 'just', 'now', 'hey', 'ok', 'okay'
+))
+
+def _canonicalize_prompt(text: str) -> str:
+    """Lowercase a query and drop filler words before embedding"""
+    words = [w for w in text.lower().split() if w not in _FILLER_WORDS]
+    return ' '.join(words) if words else text.lower().strip()
+
+class _SemanticCommandCache:
+    """Embedding-similarity cache for natural-language command translations
+
+    Paraphrases like "what VLAN is ethernet1/5 in?" and "which vlan is e1/5
+    assigned to?" translate to the same commands, so lookups match on cosine
+    similarity of a local sentence embedding rather than exact text. Queries
+    are canonicalized (lowercased, fillers stripped) before embedding, and
+    entries are namespaced by model so a weaker model's translations are
+    never served for a stronger one. Bounded by LRU count and TTL. Needs
+    the optional numpy + fastembed packages; silently disabled when missing.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256, ttl: float = 3600.0):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._np = None
+        self._model = None
+        self._embeddings = None  # (N, dim) matrix of normalized embeddings
+        self._entries = []       # parallel list of (namespace, query, commands, last_used)
+        self._disabled = False
+
+    def _ensure_model(self) -> bool:
+        """Load the embedding model on first use; disable on import failure"""
+        if self._disabled:
+            return False
+        if self._model is None:
+            try:
+                import numpy as np
+                from fastembed import TextEmbedding
+                self._np = np
+                self._model = TextEmbedding("sentence-transformers/all-MiniLM-L6-v2")
+            except Exception:
+                self._disabled = True  # embedding stack not available
+                return False
+        return True
+
+    def _embed(self, text: str):
+        """Embed and L2-normalize text so dot product equals cosine similarity"""
+        embedding = self._np.array(next(iter(self._model.embed([text]))), dtype=self._np.float32)
+        norm = self._np.linalg.norm(embedding)
+        return embedding / norm if norm else embedding
+
+    def _evict(self):
+        """Drop expired entries plus the least recently used beyond the bound"""
+        now = time.time()
+        keep = [i for i, entry in enumerate(self._entries) if now - entry[3] <= self.ttl]
+        if len(keep) > self.max_entries:
+            keep.sort(key=lambda i: self._entries[i][3])
+            keep = sorted(keep[-self.max_entries:])
+
+        if len(keep) != len(self._entries):
+            self._entries = [self._entries[i] for i in keep]
+            self._embeddings = self._embeddings[keep] if keep else None
+
+    def get(self, query: str, namespace: str = "") -> Optional[List[str]]:
+        """Return cached commands for the closest stored query, if similar enough"""
+        if not self._ensure_model() or self._embeddings is None:
+            return None
+
+        self._evict()
+        if self._embeddings is None:
+            return None
+
+        similarities = self._embeddings @ self._embed(_canonicalize_prompt(query))
+
+        best = -1
+        best_sim = self.threshold
+        for i, entry in enumerate(self._entries):
+            if entry[0] == namespace and similarities[i] >= best_sim:
+                best, best_sim = i, similarities[i]
+
+        if best >= 0:
+            ns, q, commands, _ = self._entries[best]
+            self._entries[best] = (ns, q, commands, time.time())  # refresh LRU
+            return list(commands)
+        return None
+
+    def put(self, query: str, commands: List[str], namespace: str = ""):
+        """Store a translated query for future similarity lookups"""
+        if not self._ensure_model():
+            return
+
+        row = self._embed(_canonicalize_prompt(query)).reshape(1, -1)
+        if self._embeddings is None:
+            self._embeddings = row
+        else:
+            self._embeddings = self._np.vstack([self._embeddings, row])
+        self._entries.append((namespace, query, list(commands), time.time()))
+        self._evict()
 
 class AIModelManager:
     """Manages different AI models (OpenAI, Anthropic Claude, Ollama)"""
@@ -210,32 +948,87 @@ class AIModelManager:
     def __init__(self):
         self.available_models = {}
         self.current_model = None
+        self._info_cache = None
         self.setup_models()
+        self._warm_default_model()
+
+    def _warm_default_model(self):
+        """Pre-open the default provider's HTTP connection in the background
+
+        The first real invoke otherwise pays the TLS handshake (~300ms); a
+        tiny request from a daemon thread leaves a pooled connection behind
+        that the user's first prompt reuses. Best-effort only.
+        """
+        if not self.current_model:
+            return
+
+        def warm():
+            try:
+                from langchain_core.messages import HumanMessage
+                self.get_current_model().invoke([HumanMessage(content='.')], max_tokens=1)
+            except Exception:
+                pass
+
+        threading.Thread(target=warm, daemon=True).start()
+
+    @staticmethod
+    def _openai_factory(model_name: str, api_key: str):
+        """Build a lazy constructor for a ChatOpenAI client"""
+        def make():
+            from langchain_openai import ChatOpenAI
+            return ChatOpenAI(
+                model=model_name,
+                api_key=api_key,
+                temperature=0.8,
+                max_tokens=3000
+            )
+        return make
+
+    @staticmethod
+    def _anthropic_factory(model_name: str, api_key: str):
+        """Build a lazy constructor for a ChatAnthropic client"""
+        def make():
+            from langchain_anthropic import ChatAnthropic
+            return ChatAnthropic(
+                model=model_name,
+                api_key=api_key,
+                temperature=0.8,
+                max_tokens=3000
+            )
+        return make
+
+    @staticmethod
+    def _ollama_factory(model_name: str):
+        """Build a lazy constructor for a ChatOllama client"""
+        def make():
+            from langchain_ollama import ChatOllama
+            return ChatOllama(
+                base_url="http://localhost:11434",
+                model=model_name,
+                temperature=0.1,
+                num_predict=2048
+            )
+        return make
 
     def setup_models(self):
-        """Initialize available AI models"""
+        """Register available AI models
+
+        Models are registered as lazy factories: the underlying LangChain
+        client (and its heavyweight import) is only materialized on first
+        use in get_current_model(), keeping CLI startup fast.
+        """
 
         # OpenAI GPT models
         openai_key = os.getenv("OPENAI_API_KEY")
         if openai_key:
             self.available_models["gpt-4o-mini"] = {
-                "client": ChatOpenAI(
-                    model="gpt-4o-mini",
-                    api_key=openai_key,
-                    temperature=0.8,
-                    max_tokens=3000
-                ),
+                "factory": self._openai_factory("gpt-4o-mini", openai_key),
                 "provider": "OpenAI",
                 "description": "GPT-4o Mini - Fast and efficient"
             }
 
             self.available_models["gpt-4o"] = {
-                "client": ChatOpenAI(
-                    model="gpt-4o",
-                    api_key=openai_key,
-                    temperature=0.8,
-                    max_tokens=3000
-                ),
+                "factory": self._openai_factory("gpt-4o", openai_key),
                 "provider": "OpenAI",
                 "description": "GPT-4o - Most capable OpenAI model"
             }
@@ -245,87 +1038,48 @@ class AIModelManager:
         if anthropic_key:
             # Claude 4 models (latest)
             self.available_models["claude-sonnet-4-20250514"] = {
-                "client": ChatAnthropic(
-                    model="claude-sonnet-4-20250514",
-                    api_key=anthropic_key,
-                    temperature=0.8,
-                    max_tokens=3000
-                ),
+                "factory": self._anthropic_factory("claude-sonnet-4-20250514", anthropic_key),
                 "provider": "Anthropic",
                 "description": "Claude Sonnet 4 - Latest and most capable Claude model"
             }
 
             self.available_models["claude-opus-4-20250514"] = {
-                "client": ChatAnthropic(
-                    model="claude-opus-4-20250514",
-                    api_key=anthropic_key,
-                    temperature=0.8,
-                    max_tokens=3000
-                ),
+                "factory": self._anthropic_factory("claude-opus-4-20250514", anthropic_key),
                 "provider": "Anthropic",
                 "description": "Claude Opus 4 - Latest and most capable Claude model"
             }
 
             # Claude 3.5 models
             self.available_models["claude-3-5-sonnet-20241022"] = {
-                "client": ChatAnthropic(
-                    model="claude-3-5-sonnet-20241022",
-                    api_key=anthropic_key,
-                    temperature=0.8,
-                    max_tokens=3000
-                ),
+                "factory": self._anthropic_factory("claude-3-5-sonnet-20241022", anthropic_key),
                 "provider": "Anthropic",
                 "description": "Claude 3.5 Sonnet - Excellent reasoning and analysis"
             }
 
             self.available_models["claude-3-haiku-20240307"] = {
-                "client": ChatAnthropic(
-                    model="claude-3-haiku-20240307",
-                    api_key=anthropic_key,
-                    temperature=0.8,
-                    max_tokens=3000
-                ),
+                "factory": self._anthropic_factory("claude-3-haiku-20240307", anthropic_key),
                 "provider": "Anthropic",
                 "description": "Claude 3 Haiku - Fast and efficient"
             }
 
-        # Ollama (local models)
-        try:
-            # Test if Ollama is available
-            import requests
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
-            if response.status_code == 200:
-                self.available_models["llama3.3"] = {
-                    "client": ChatOllama(
-                        base_url="http://localhost:11434",
-                        model="llama3.3",
-                        temperature=0.1,
-                        num_predict=2048
-                    ),
-                    "provider": "Ollama",
-                    "description": "Llama 3.3 - Local model"
-                }
-        except:
-            pass  # Ollama not available
-
-        # Set default model
-        if self.available_models:
-            # Prefer Claude Sonnet 4, then Claude 3.5 Sonnet, then GPT, then others
-            claude_4_models = [model for model in self.available_models if "claude-sonnet-4" in model]
-            claude_3_5_models = [model for model in self.available_models if "claude-3-5-sonnet" in model]
-            gpt_4o_mini_models = [model for model in self.available_models if "gpt-4o-mini" in model]
-            llama3_70b_models = [model for model in self.available_models if "llama3.3" in model]
-
-            if claude_4_models:
-                self.current_model = claude_4_models[0]
-            elif claude_3_5_models:
-                self.current_model = claude_3_5_models[0]
-            elif gpt_4o_mini_models:
-                self.current_model = gpt_4o_mini_models[0]
-            elif llama3_70b_models:
-                self.current_model = llama3_70b_models[0]
-            else:
-                self.current_model = list(self.available_models.keys())[0]
+        # Ollama (local models, opt-in via NEXUS_ENABLE_OLLAMA)
+        if _ollama_is_available():
+            self.available_models["llama3.3"] = {
+                "factory": self._ollama_factory("llama3.3"),
+                "provider": "Ollama",
+                "description": "Llama 3.3 - Local model"
+            }
+
+        # Set default model: first priority-table hit, else first registered
+        priority = _MODEL_PRIORITY
+        env_priority = os.getenv("NEXUS_MODEL_PRIORITY")
+        if env_priority:
+            priority = tuple(name.strip() for name in env_priority.split(',') if name.strip())
+
+        self.current_model = next(
+            (model for model in priority if model in self.available_models),
+            next(iter(self.available_models), None)
+        )
 
     def get_available_models(self) -> Dict:
         """Get list of available models"""
@@ -335,22 +1089,30 @@ class AIModelManager:
         """Set the current model"""
         if model_name in self.available_models:
             self.current_model = model_name
+            self._info_cache = None
             return True
         return False
 
     def get_current_model(self):
-        """Get the current model client"""
+        """Get the current model client, materializing it on first use"""
         if self.current_model and self.current_model in self.available_models:
-            return self.available_models[self.current_model]["client"]
+            model_info = self.available_models[self.current_model]
+            if model_info.get("client") is None:
+                model_info["client"] = model_info["factory"]()
+            return model_info["client"]
         return None
 
     def get_current_model_info(self) -> Dict:
-        """Get current model information"""
+        """Get current model information (cached until the model changes)"""
+        if self._info_cache is not None:
+            return self._info_cache
+
         if self.current_model and self.current_model in self.available_models:
-            return {
+            self._info_cache = {
                 "name": self.current_model,
                 **self.available_models[self.current_model]
             }
+            return self._info_cache
         return None
 
     def display_available_models(self, console: Console):
@@ -383,9 +1145,11 @@ class AIModelManager:
         console.print(f"[dim]Use --model <model_name> to specify a different model[/dim]")
 
 class NaturalLanguageNexusCLI:
-    def __init__(self, initial_model: Optional[str] = None, show_raw: bool = False):
-        self.console = Console()
+    def __init__(self, initial_model: Optional[str] = None, show_raw: bool = False,
+                 auto_confirm: bool = False):
+        self.console = get_console()
         self.show_raw = show_raw  # Store the show_raw flag
+        self.auto_confirm = auto_confirm  # --yes: skip confirmation prompts
 
         # Initialize AI Model Manager
         self.ai_manager = AIModelManager()
@@ -415,12 +1179,50 @@ class NaturalLanguageNexusCLI:
         self.switches = self.load_switches()
         self.current_switch = None
 
+        # Exact-match translation cache (natural language -> command list)
+        self._cmd_cache: Dict[str, List[str]] = self._load_cmd_cache()
+
+        # Similarity cache catching paraphrases the exact cache misses
+        self._semantic_cache = _SemanticCommandCache()
+
+        # Session-local memo for AI command suggestions, keyed (model, context)
+        self._suggestion_cache: OrderedDict = OrderedDict()
+
+        # Exact-match analysis cache: key -> (analysis text, stored-at)
+        self._analysis_cache: OrderedDict = OrderedDict()
+
+        # Dedup keys for session_notes, bounded like the deque it mirrors
+        self._session_note_keys: OrderedDict = OrderedDict()
+
+        # Last LLM translation turn, kept so the analysis call can continue
+        # the same conversation and reuse its provider-side cached prefix
+        self._last_translation = None
+
+        # Persistent REPL input session, created lazily on first prompt
+        self._session = None
+        self._no_prompt_toolkit = False
+
+        # Builtin interactive commands dispatch on one dict lookup; exit is
+        # special-cased by the loop since it has to break out of it
+        self._builtin_cmds = {
+            'help': self.show_help,
+            'models': self.select_model,
+            'model': self.select_model,
+            'switches': self.show_available_switches,
+            'switch': self._builtin_select_switch,
+            'history': self.show_command_history,
+            'suggestions': self.show_suggestions,
+            'suggest': self.show_suggestions,
+            'ideas': self.show_suggestions,
+            'clear': self._builtin_clear,
+        }
+
         # Command history and context
         self.command_history = []
         self.context = {
             "last_command": None,
             "last_output": None,
-            "session_notes": []
+            "session_notes": deque(maxlen=200)
         }
 
         # Only show the panel in interactive mode (not batch mode)
@@ -436,6 +1238,47 @@ class NaturalLanguageNexusCLI:
         """Display available AI models"""
         self.ai_manager.display_available_models(self.console)
 
+    def _builtin_select_switch(self):
+        """Builtin handler: switch the active target switch"""
+        new_switch = self.select_switch()
+        if new_switch:
+            self.current_switch = new_switch
+
+    def _builtin_clear(self):
+        """Builtin handler: clear the terminal"""
+        if os.name == 'posix':
+            # ANSI write instead of forking /usr/bin/clear
+            self.console.clear()
+        else:
+            os.system('cls')  # Windows terminals may not honor ANSI
+
+    def _system_message(self, text: str):
+        """Build a system message, marked cacheable for Anthropic models
+
+        Anthropic caches the (large, static) system prompt server-side when
+        it carries an ephemeral cache_control marker; OpenAI caches
+        byte-identical prefixes automatically, so plain text suffices there.
+        """
+        from langchain_core.messages import SystemMessage
+
+        model_info = self.ai_manager.get_current_model_info()
+        if model_info and model_info.get("provider") == "Anthropic":
+            return SystemMessage(content=[{
+                "type": "text",
+                "text": text,
+                "cache_control": {"type": "ephemeral"}
+            }])
+        return SystemMessage(content=text)
+
+    def _current_model_info(self) -> Dict:
+        """Accessor for the active model's info dict
+
+        The manager memoizes per selected model, so hot-loop callers pay a
+        method call rather than a rebuilt dict; select_model invalidates
+        through ai_manager.set_model.
+        """
+        return self.ai_manager.get_current_model_info()
+
     def select_model(self) -> bool:
         """Interactive model selection"""
         models = self.ai_manager.get_available_models()
@@ -461,280 +1304,246 @@ class NaturalLanguageNexusCLI:
         return False
 
     def load_switches(self) -> List[NexusSwitch]:
-        """Load switch configurations"""
+        """Load switch configurations, reusing a parsed cache on warm runs"""
+        # The C-accelerated loader is ~5x faster when libyaml is present
+        import yaml
+
         try:
-            with open("config/switches.yaml", 'r') as f:
-                config = yaml.safe_load(f)
+            mtime = os.stat(_SWITCHES_CONFIG_PATH).st_mtime
+
+            # Warm path: skip the YAML parse while the file is unchanged
+            try:
+                with open(_SWITCHES_CACHE_PATH, 'rb') as f:
+                    cached_mtime, switches = pickle.load(f)
+                if cached_mtime == mtime:
+                    return switches
+            except Exception:
+                pass  # missing/stale cache - fall through to the parse
+
+            with open(_SWITCHES_CONFIG_PATH, 'r') as f:
+                config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
             switches = []
             for switch_config in config['switches']:
                 switches.append(NexusSwitch(**switch_config))
 
+            try:
+                os.makedirs(os.path.dirname(_SWITCHES_CACHE_PATH), exist_ok=True)
+                with open(_SWITCHES_CACHE_PATH, 'wb') as f:
+                    pickle.dump((mtime, switches), f)
+            except Exception:
+                pass  # cache persistence is best-effort
+
             return switches
         except Exception as e:
             self.console.print(f"[red]Error loading switches: {e}[/red]")
             self.console.print("[yellow]Please ensure config/switches.yaml exists and is properly formatted[/yellow]")
-            return []
-
-    def show_available_switches(self):
-        """Display available switches in a nice table"""
-        table = Table(title="Available Nexus Switches")
-        table.add_column("Index", style="cyan", no_wrap=True)
-        table.add_column("Hostname", style="green")
-        table.add_column("IP Address", style="blue")
-        table.add_column("Status", style="yellow")
-
-        for i, switch in enumerate(self.switches):
-            # Quick connectivity test
-            client = NexusClient(switch)
-            status = "🟢 Online" if client.connect_ssh() else "🔴 Offline"
-            client.close()
-
-            table.add_row(
-                str(i + 1),
-                switch.hostname,
-                switch.ip,
-                status
-            )
-
-        self.console.print(table)
-
-    def select_switch(self) -> Optional[NexusSwitch]:
-        """Interactive switch selection"""
-        self.show_available_switches()
-
-        if not self.switches:
-            self.console.print("[red]No switches configured![/red]")
-            return None
-
-        while True:
-            try:
-                choice = Prompt.ask(
-                    "Select a switch",
-                    choices=[str(i + 1) for i in range(len(self.switches))],
-                    default="1"
-                )
-
-                selected_switch = self.switches[int(choice) - 1]
-                self.console.print(f"[green]✅ Selected: {selected_switch.hostname} ({selected_switch.ip})[/green]")
-                return selected_switch
-
-            except (ValueError, IndexError):
-                self.console.print("[red]Invalid selection. Please try again.[/red]")
-
-    def validate_nexus_commands(self, commands: List[str]) -> List[str]:
-        """Validate and correct common Nexus command syntax issues"""
-        validated_commands = []
-
-        # Common IOS to Nexus command translations with strict blocking
-        ios_to_nexus = {
-            "show bgp summary": "show bgp l2vpn evpn summary",
-            "show bgp neighbors": "show bgp l2vpn evpn neighbors",
-            "show ip bgp summary": "show bgp ipv4 unicast summary",
-            "show ip bgp neighbors": "show bgp ipv4 unicast neighbors",
-            "show processes cpu": "show system resources",
-            "show processes": "show system resources",
-            "show interface e1/": "show interface ethernet1/",
-            "show int e1/": "show interface ethernet1/",
-        }
-
-        for command in commands:
-            validated_command = command
-            command_blocked = False
-
-            # Strict blocking of IOS commands
-            if command.lower().strip() in ["show bgp summary", "show bgp neighbors", "show ip bgp"]:
-                if "show bgp neighbors" in command.lower():
-                    validated_command = "show bgp l2vpn evpn neighbors"
-                elif "show bgp summary" in command.lower():
-                    validated_command = "show bgp l2vpn evpn summary"
-                elif "show ip bgp" in command.lower():
-                    validated_command = "show bgp ipv4 unicast summary"
-
-                self.console.print(f"[red]🚫 Blocked IOS command: '{command}'[/red]")
-                self.console.print(f"[green]✅ Using Nexus command: '{validated_command}'[/green]")
-                command_blocked = True
-
-            # Check for common IOS syntax and correct it
-            if not command_blocked:
-                for ios_cmd, nexus_cmd in ios_to_nexus.items():
-                    if ios_cmd in command.lower():
-                        validated_command = command.lower().replace(ios_cmd, nexus_cmd)
-                        self.console.print(f"[yellow]🔧 Corrected: '{command}' → '{validated_command}'[/yellow]")
-                        break
-
-            # Check for other common issues
-            if "show interface e1/" in validated_command:
-                validated_command = validated_command.replace("show interface e1/", "show interface ethernet1/")
-                self.console.print(f"[yellow]🔧 Corrected interface syntax: '{command}' → '{validated_command}'[/yellow]")
-
-            validated_commands.append(validated_command)
-
-        return validated_commands
-
-    def translate_natural_language_to_commands(self, natural_input: str) -> List[str]:
-        """Convert natural language to Nexus CLI commands using AI"""
-
-        system_prompt = '''You are an expert Cisco Nexus network engineer. Convert natural language requests into appropriate Nexus CLI commands.
-
-CRITICAL: Use ONLY NEXUS-SPECIFIC syntax. NEVER use IOS commands!
-IMPORTANT: Return ONLY the CLI commands, one per line. Do NOT use markdown code blocks (```). Do NOT include explanatory text.
-
-IMPORTANT: For VLAN-related queries about interface assignments, use these approaches:
-- To find which VLAN an interface is assigned to: Use "show vlan brief" (shows all VLANs and their port assignments)
-- To see interface configuration: Use "show running-config interface ethernetX/X"
-- To see interface status: Use "show interface ethernetX/X"
-
-• If configuration is needed, include commands such as:
-  - configure terminal
-  - snmp-server community public ro
-  - feature <feature-name>
-  - interface ethernetX/X
-  - vlan <id>
-  - router bgp <asn>
-  - address-family l2vpn evpn
-  - no shutdown
-
-📌 Examples:
-Input: "Which VLAN is interface e1/7 assigned to?"
-Output:
-show vlan brief
-
-Input: "What VLAN is ethernet1/5 in?"
-Output:
-show vlan brief
-
-Input: "Show me the VLAN assignment for interface e1/10"
-Output:
-show vlan brief
-
-Input: "Configure SNMP v2 with community public"
-Output:
-configure terminal
-snmp-server community public ro
+            return []
 
-Input: "Enable BGP on AS 65001"
-Output:
-configure terminal
-feature bgp
-router bgp 65001
+    def show_available_switches(self):
+        """Display available switches in a nice table"""
+        table = Table(title="Available Nexus Switches")
+        table.add_column("Index", style="cyan", no_wrap=True)
+        table.add_column("Hostname", style="green")
+        table.add_column("IP Address", style="blue")
+        table.add_column("Status", style="yellow")
 
-Input: "Create VLAN 100 named USERS"
-Output:
-configure terminal
-vlan 100
-  name USERS
+        def probe(switch: NexusSwitch) -> bool:
+            # Quick connectivity test - a raw TCP connect to the SSH port is
+            # enough to mark reachability without paying the SSH key exchange
+            try:
+                socket.create_connection((switch.ip, switch.ssh_port), timeout=2).close()
+                return True
+            except OSError:
+                return False
+
+        # Probe all switches in parallel; each probe is independent I/O
+        if self.switches:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, len(self.switches))
+            ) as executor:
+                statuses = list(executor.map(probe, self.switches))
+        else:
+            statuses = []
 
-Input: "Configure interface e1/7 as access port and add it to vlan 100"
-Output:
-configure terminal
-interface ethernet1/7
-description "Access Port for VLAN 100"
-switchport
-switchport mode access
-switchport access vlan 100
-no shutdown
+        for i, (switch, online) in enumerate(zip(self.switches, statuses)):
+            table.add_row(
+                str(i + 1),
+                switch.hostname,
+                switch.ip,
+                "🟢 Online" if online else "🔴 Offline"
+            )
 
-Input: "Enable interface Ethernet1/1"
-Output:
-configure terminal
-interface ethernet1/1
-no shutdown
+        self.console.print(table)
 
-Input: "Enable interface range Ethernet1/1-7"
-Output:
-configure terminal
-interface ethernet1/1-7
-no shutdown
+    def select_switch(self) -> Optional[NexusSwitch]:
+        """Interactive switch selection"""
+        self.show_available_switches()
 
-Input: "Disable interface range Ethernet1/1-7"
-Output:
-configure terminal
-interface ethernet1/1-7
-shutdown
+        if not self.switches:
+            self.console.print("[red]No switches configured![/red]")
+            return None
 
-Input: "Default interface Ethernet1/1"
-Output:
-configure terminal
-default interface ethernet1/1
+        while True:
+            try:
+                choice = Prompt.ask(
+                    "Select a switch",
+                    choices=[str(i + 1) for i in range(len(self.switches))],
+                    default="1"
+                )
 
-FORBIDDEN IOS Commands (DO NOT USE):
-- show bgp summary (IOS) ❌
-- show bgp neighbors (IOS) ❌
-- show ip bgp (IOS) ❌
-- show processes (IOS) ❌
-- show vlan interface (IOS style) ❌
+                selected_switch = self.switches[int(choice) - 1]
+                self.console.print(f"[green]✅ Selected: {selected_switch.hostname} ({selected_switch.ip})[/green]")
+                return selected_switch
 
-REQUIRED NEXUS Commands:
+            except (ValueError, IndexError):
+                self.console.print("[red]Invalid selection. Please try again.[/red]")
 
-BGP Commands:
-- show bgp l2vpn evpn summary (for EVPN neighbors)
-- show bgp l2vpn evpn neighbors (for EVPN neighbor details)
-- show bgp ipv4 unicast summary (for IPv4 BGP)
-- show bgp ipv4 unicast neighbors (for IPv4 BGP neighbors)
-- show bgp ipv6 unicast summary (for IPv6 BGP)
-- show bgp process (BGP process information)
-- show bgp sessions (all BGP sessions)
+    def validate_nexus_commands(self, commands: List[str]) -> List[str]:
+        """Validate and correct common Nexus command syntax issues
 
-Interface Commands:
-- show running-config interface ethernet1/1
-- show interface
-- show interface brief
-- show ip interface brief
-- show interface ethernet1/1 (NOT e1/1)
-- show interface status
-- show interface status up
-- show interface counters errors
+        Each command is scanned exactly once: known-bad exact IOS commands
+        are blocked outright, then a single compiled alternation rewrites
+        any embedded IOS syntax to its Nexus equivalent case-insensitively.
+        """
+        validated_commands = []
 
-System Commands:
-- show system resources (NOT show processes)
-- show environment
-- show version
-- show module
+        for command in commands:
+            # Strict blocking of IOS commands
+            stripped_lower = command.lower().strip()
+            if stripped_lower in _BLOCKED_IOS_COMMANDS:
+                validated_command = _NEXUS_REPLACEMENTS[stripped_lower]
+                self.console.print(f"[red]🚫 Blocked IOS command: '{command}'[/red]")
+                self.console.print(f"[green]✅ Using Nexus command: '{validated_command}'[/green]")
+            else:
+                # Rewrite any IOS syntax in one pass over the command
+                validated_command = _IOS_RE.sub(
+                    lambda m: _IOS_TO_NEXUS[m.group(0).lower()], command
+                )
+                if validated_command != command:
+                    self.console.print(f"[yellow]🔧 Corrected: '{command}' → '{validated_command}'[/yellow]")
 
-VLAN Commands:
-- show vlan brief (shows all VLANs and their port assignments)
-- show vlan id <vlan-id>
-- show running-config vlan
-- show running-config interface ethernet1/X (to see interface VLAN config)
+            validated_commands.append(validated_command)
 
-NEVER generate these IOS commands:
-- show bgp summary
-- show bgp neighbors
-- show ip bgp
-- show processes cpu
-- show vlan interface
+        return validated_commands
 
-REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks.'''
+    def _load_cmd_cache(self) -> Dict[str, List[str]]:
+        """Load the persisted translation cache, tolerating a missing/corrupt file"""
+        try:
+            with open(_CMD_CACHE_PATH, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict):
+                return cache
+        except Exception:
+            pass
+        return {}
+
+    def _save_cmd_cache(self):
+        """Persist the translation cache for future CLI invocations"""
+        try:
+            os.makedirs(os.path.dirname(_CMD_CACHE_PATH), exist_ok=True)
+            with open(_CMD_CACHE_PATH, 'w') as f:
+                json.dump(self._cmd_cache, f)
+        except Exception:
+            pass  # cache persistence is best-effort
+
+    def _cmd_cache_put(self, cache_key: str, commands: List[str]):
+        """Store a translation, evicting oldest entries beyond the LRU bound"""
+        self._cmd_cache.pop(cache_key, None)
+        self._cmd_cache[cache_key] = commands
+        while len(self._cmd_cache) > _CMD_CACHE_MAX_ENTRIES:
+            self._cmd_cache.pop(next(iter(self._cmd_cache)))
+        self._save_cmd_cache()
+
+    def translate_natural_language_to_commands(self, natural_input: str) -> List[str]:
+        """Convert natural language to Nexus CLI commands using AI"""
+        from langchain_core.messages import HumanMessage, SystemMessage
 
         user_prompt = f"Convert this natural language request to Nexus CLI commands:\n\n{natural_input}"
 
+        # Exact-match cache: identical (model, prompt, input) tuples skip the
+        # LLM round-trip entirely
+        model_name = self.ai_manager.current_model or ""
+        cache_key = hashlib.sha256(
+            (model_name + _NEXUS_SYSTEM_PROMPT + natural_input).encode()
+        ).hexdigest()
+
+        cached = self._cmd_cache.get(cache_key)
+        if cached is not None:
+            # Refresh LRU position on hit
+            self._cmd_cache.pop(cache_key)
+            self._cmd_cache[cache_key] = cached
+            return list(cached)
+
+        # Semantic layer: paraphrases of earlier queries share their entry.
+        # Queries carrying dynamic tokens (IPs, interface names) skip it —
+        # near-identical wording about a different interface must not match.
+        use_semantic = not _has_dynamic_tokens(natural_input)
+        if use_semantic:
+            similar = self._semantic_cache.get(natural_input, namespace=model_name)
+            if similar is not None:
+                self._cmd_cache_put(cache_key, similar)
+                return similar
+
         try:
             llm = self.ai_manager.get_current_model()
             if not llm:
                 self.console.print("[red]No AI model available![/red]")
                 return []
 
-            response = llm.invoke([
-                SystemMessage(content=system_prompt),
+            # Stream the response, parsing and validating each command line as
+            # soon as it completes instead of blocking on the full generation
+            validated_commands = []
+            commands_text = ""
+            parsed_upto = 0
+
+            system_message = self._system_message(_NEXUS_SYSTEM_PROMPT)
+
+            for chunk in llm.stream([
+                system_message,
                 HumanMessage(content=user_prompt)
-            ])
+            ]):
+                piece = chunk.content
+                if isinstance(piece, list):
+                    # Anthropic-style content blocks
+                    piece = "".join(
+                        p.get("text", "") if isinstance(p, dict) else str(p)
+                        for p in piece
+                    )
+                commands_text += piece
+
+                # Check if AI is asking for clarification (or might still be -
+                # wait until we have enough characters to tell)
+                head = commands_text.lstrip()
+                if head.startswith("CLARIFY:") or "CLARIFY:".startswith(head):
+                    continue
 
-            commands_text = response.content.strip()
+                # Pop completed lines and validate them while tokens stream in
+                while True:
+                    newline = commands_text.find('\n', parsed_upto)
+                    if newline < 0:
+                        break
+                    line = commands_text[parsed_upto:newline].strip()
+                    parsed_upto = newline + 1
+                    if line and not line.startswith('```'):
+                        validated_commands.extend(self.validate_nexus_commands([line]))
 
             # Check if AI is asking for clarification
-            if commands_text.startswith("CLARIFY:"):
-                self.console.print(f"[yellow]🤔 {commands_text[9:]}[/yellow]")
+            stripped_text = commands_text.strip()
+            if stripped_text.startswith("CLARIFY:"):
+                self.console.print(f"[yellow]🤔 {stripped_text[9:]}[/yellow]")
                 return []
 
-            # Parse commands (one per line)
-            commands = [cmd.strip() for cmd in commands_text.split('\n') if cmd.strip() and not cmd.strip().startswith('```')]
+            # Flush the trailing line (no final newline in the response)
+            tail = commands_text[parsed_upto:].strip()
+            if tail and not tail.startswith('```'):
+                validated_commands.extend(self.validate_nexus_commands([tail]))
 
-            # Additional validation to catch any IOS commands that slipped through
-            commands = self.strict_nexus_validation(commands)
-
-            # Validate and correct Nexus syntax
-            validated_commands = self.validate_nexus_commands(commands)
+            if validated_commands:
+                self._cmd_cache_put(cache_key, validated_commands)
+                if use_semantic:
+                    self._semantic_cache.put(natural_input, validated_commands, namespace=model_name)
+                self._last_translation = (natural_input, user_prompt, commands_text)
 
             return validated_commands
 
@@ -742,49 +1551,6 @@ REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks
             self.console.print(f"[red]Error translating command: {e}[/red]")
             return []
 
-    def strict_nexus_validation(self, commands: List[str]) -> List[str]:
-        """Strict validation to prevent any IOS commands"""
-        validated_commands = []
-
-        # Forbidden IOS patterns
-        forbidden_patterns = [
-            "show bgp summary",
-            "show bgp neighbors",
-            "show ip bgp",
-            "show processes cpu",
-            "show processes"
-        ]
-
-        # Required Nexus replacements
-        nexus_replacements = {
-            "show bgp summary": "show bgp l2vpn evpn summary",
-            "show bgp neighbors": "show bgp l2vpn evpn neighbors",
-            "show ip bgp summary": "show bgp ipv4 unicast summary",
-            "show ip bgp neighbors": "show bgp ipv4 unicast neighbors",
-            "show processes cpu": "show system resources",
-            "show processes": "show system resources"
-        }
-
-        for command in commands:
-            command_lower = command.lower().strip()
-
-            # Check if this is a forbidden IOS command
-            forbidden_found = False
-            for forbidden in forbidden_patterns:
-                if forbidden in command_lower:
-                    if forbidden in nexus_replacements:
-                        corrected = nexus_replacements[forbidden]
-                        self.console.print(f"[red]🚫 Blocked IOS command: '{command}'[/red]")
-                        self.console.print(f"[green]✅ Using Nexus equivalent: '{corrected}'[/green]")
-                        validated_commands.append(corrected)
-                        forbidden_found = True
-                        break
-
-            if not forbidden_found:
-                validated_commands.append(command)
-
-        return validated_commands
-
     def suggest_command_correction(self, failed_command: str, error_output: str) -> Optional[str]:
         """Suggest command corrections based on common Nexus syntax issues"""
 
@@ -824,38 +1590,38 @@ REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks
         current_block = []
         individual_commands = []
 
-        for command in commands:
-            command_lower = command.lower().strip()
+        # Classify every command up front; the grouping state machine then
+        # branches on small int codes instead of re-scanning each string
+        classified = [(command, _classify(command.lower().strip())) for command in commands]
 
-            # Handle show commands individually - they don't need grouping
-            if command_lower.startswith('show ') or command_lower.startswith('display '):
+        for command, kind in classified:
+            # Show commands run individually - they don't need grouping
+            if kind == _CMD_SHOW:
                 individual_commands.append(command)
-                continue
 
-            # Check if this is an interface configuration command
-            if command_lower.startswith('interface '):
-                # Save previous block if exists
+            elif kind == _CMD_IFACE:
+                # Save previous block if exists (moved, not copied: a new
+                # list is bound below)
                 if current_interface and current_block:
-                    interface_blocks[current_interface] = current_block.copy()
+                    interface_blocks[current_interface] = current_block
 
-                # Start new interface block
-                current_interface = command.split()[1] if len(command.split()) > 1 else "unknown"
+                # Start new interface block (split once, only up to the name)
+                parts = command.split(None, 2)
+                current_interface = parts[1] if len(parts) > 1 else "unknown"
                 current_block = ['configure terminal', command]
 
-            elif current_interface and any(keyword in command_lower for keyword in
-                                         ['description', 'switchport', 'no shutdown', 'shutdown',
-                                          'ip address', 'spanning-tree', 'mtu', 'speed', 'duplex']):
+            elif kind == _CMD_IFACE_SUB and current_interface:
                 # Add to current interface block
                 current_block.append(command)
 
-            elif command_lower == 'configure terminal':
+            elif kind == _CMD_CONF_TERM:
                 # Skip standalone configure terminal commands
                 continue
 
             else:
                 # Save current interface block if exists
                 if current_interface and current_block:
-                    interface_blocks[current_interface] = current_block.copy()
+                    interface_blocks[current_interface] = current_block
                     current_interface = None
                     current_block = []
 
@@ -874,17 +1640,55 @@ REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks
 
     def is_command_failure(self, output: str) -> bool:
         """Check if command output indicates a failure"""
-        failure_indicators = [
-            "Invalid command",
-            "% Invalid",
-            "Syntax error",
-            "Command not found",
-            "% Ambiguous command",
-            "Permission denied",
-            "Authentication failed"
-        ]
-
-        return any(indicator in output for indicator in failure_indicators)
+        return _RE_FAIL.search(output) is not None
+
+    def _run_one(self, client: NexusClient, command: str, results: Dict,
+                 precomputed: Optional[str] = None) -> str:
+        """Run one command with failure detection and suggested corrections
+
+        precomputed carries output already fetched by a pipelined batch so
+        the command is not re-sent. Returns the key the output was stored
+        under (the corrected command when a suggestion was taken).
+        """
+        self.console.print(Text.assemble(("Executing: ", "cyan"), (command, "bold")))
+
+        if precomputed is not None:
+            output = precomputed
+        else:
+            with self.console.status(f"Running '{command}'...", spinner="dots"):
+                output = client.execute_command(command)
+
+        # Check for actual command failures (not just any error text)
+        if self.is_command_failure(output):
+            self.console.print(Text.assemble(("❌ Command failed: ", "red"), (command, "red")))
+
+            # Try to suggest a correction
+            suggested_command = self.suggest_command_correction(command, output)
+            if suggested_command:
+                self.console.print(Text.assemble(("💡 Suggested correction: ", "yellow"), (suggested_command, "yellow")))
+
+                # In batch mode with show_raw, don't ask for confirmation
+                if self.show_raw or self.auto_confirm or Confirm.ask("Try the suggested command?", default=True):
+                    results[suggested_command] = client.execute_command(suggested_command)
+                    self.console.print("[green]✅ Corrected command executed successfully[/green]")
+                    return suggested_command
+        else:
+            self.console.print("[green]✅ Command executed successfully[/green]")
+
+        results[command] = output
+        return command
+
+    def _record_history(self, switch: NexusSwitch, command: str, output: str):
+        """Track the last command and output in context and history"""
+        self.context["last_command"] = command
+        self.context["last_output"] = output
+
+        self.command_history.append({
+            "ts": time.time(),
+            "switch": switch.hostname,
+            "command": command,
+            "output": _truncate(output)
+        })
 
     def execute_commands_on_switch(self, commands: List[str], switch: NexusSwitch) -> Dict:
         """Execute commands on the selected switch with proper context handling"""
@@ -900,193 +1704,201 @@ REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks
             interface_blocks = self.group_interface_commands(commands)
 
             if interface_blocks:
+                # Pipeline all plain show commands through one shell round
+                # trip; failure detection and corrections run on the returned
+                # outputs afterwards. Only safe when there are no config
+                # blocks: shows that follow a config change must observe the
+                # post-change state, so mixed runs keep the baseline order
+                # (config blocks first, then each show individually).
+                has_config_blocks = any(
+                    not block_name.startswith('individual_')
+                    for block_name in interface_blocks
+                )
+
+                batchable = [] if has_config_blocks else [
+                    block_commands[0]
+                    for block_name, block_commands in interface_blocks.items()
+                    if block_name.startswith('individual_')
+                    and block_commands[0].lower().strip().startswith(('show ', 'display '))
+                ]
+
+                batched_outputs = {}
+                if len(batchable) > 1:
+                    with self.console.status(f"Running {len(batchable)} commands...", spinner="dots"):
+                        batched_outputs = client.execute_command_batch(batchable)
+
                 # Execute interface configurations as blocks
                 for block_name, block_commands in interface_blocks.items():
                     if block_name.startswith('individual_'):
-                        # Execute individual commands normally
-                        command = block_commands[0]
-                        self.console.print(f"[cyan]Executing:[/cyan] [bold]{command}[/bold]")
-
-                        with self.console.status(f"Running '{command}'...", spinner="dots"):
-                            output = client.execute_command(command)
-
-                            # Check for actual command failures (not just any error text)
-                            if self.is_command_failure(output):
-                                self.console.print(f"[red]❌ Command failed: {command}[/red]")
-
-                                # Try to suggest a correction
-                                suggested_command = self.suggest_command_correction(command, output)
-                                if suggested_command:
-                                    self.console.print(f"[yellow]💡 Suggested correction: {suggested_command}[/yellow]")
-
-                                    # In batch mode with show_raw, don't ask for confirmation
-                                    if self.show_raw:
-                                        corrected_output = client.execute_command(suggested_command)
-                                        results[suggested_command] = corrected_output
-                                        self.console.print(f"[green]✅ Corrected command executed successfully[/green]")
-                                        continue
-                                    elif Confirm.ask("Try the suggested command?", default=True):
-                                        corrected_output = client.execute_command(suggested_command)
-                                        results[suggested_command] = corrected_output
-                                        self.console.print(f"[green]✅ Corrected command executed successfully[/green]")
-                                        continue
-                            else:
-                                self.console.print(f"[green]✅ Command executed successfully[/green]")
-
-                            results[command] = output
+                        # `or None` demotes an empty batch section to a miss
+                        # so _run_one re-runs the command individually
+                        executed = self._run_one(client, block_commands[0], results,
+                                                 precomputed=batched_outputs.get(block_commands[0]) or None)
                     else:
                         # Execute interface configuration as a block
-                        self.console.print(f"[cyan]Executing interface block:[/cyan] [bold]{block_name}[/bold]")
+                        self.console.print(Text.assemble(("Executing interface block: ", "cyan"), (block_name, "bold")))
 
                         with self.console.status(f"Configuring {block_name}...", spinner="dots"):
                             combined_output = client.execute_command_block(block_commands)
 
-                        results[f"Interface Config: {block_name}"] = combined_output
+                        executed = f"Interface Config: {block_name}"
+                        results[executed] = combined_output
 
-                    # Store in context (use last command/output)
-                    if block_name.startswith('individual_'):
-                        self.context["last_command"] = block_commands[0]
-                        self.context["last_output"] = results.get(block_commands[0], "")
-                    else:
-                        self.context["last_command"] = f"Interface Config: {block_name}"
-                        self.context["last_output"] = results.get(f"Interface Config: {block_name}", "")
-
-                    # Add to history
-                    self.command_history.append({
-                        "timestamp": datetime.now().isoformat(),
-                        "switch": switch.hostname,
-                        "command": self.context["last_command"],
-                        "output": self.context["last_output"][:500] + "..." if len(self.context["last_output"]) > 500 else self.context["last_output"]
-                    })
+                    self._record_history(switch, executed, results.get(executed, ""))
             else:
                 # Execute commands individually for non-interface configs
                 for command in commands:
-                    self.console.print(f"[cyan]Executing:[/cyan] [bold]{command}[/bold]")
-
-                    with self.console.status(f"Running '{command}'...", spinner="dots"):
-                        output = client.execute_command(command)
-
-                        # Check for actual command failures (not just any error text)
-                        if self.is_command_failure(output):
-                            self.console.print(f"[red]❌ Command failed: {command}[/red]")
-
-                            # Try to suggest a correction
-                            suggested_command = self.suggest_command_correction(command, output)
-                            if suggested_command:
-                                self.console.print(f"[yellow]💡 Suggested correction: {suggested_command}[/yellow]")
-
-                                # In batch mode with show_raw, don't ask for confirmation
-                                if self.show_raw:
-                                    corrected_output = client.execute_command(suggested_command)
-                                    results[suggested_command] = corrected_output
-                                    self.console.print(f"[green]✅ Corrected command executed successfully[/green]")
-                                    continue
-                                elif Confirm.ask("Try the suggested command?", default=True):
-                                    corrected_output = client.execute_command(suggested_command)
-                                    results[suggested_command] = corrected_output
-                                    self.console.print(f"[green]✅ Corrected command executed successfully[/green]")
-                                    continue
-                        else:
-                            self.console.print(f"[green]✅ Command executed successfully[/green]")
-
-                        results[command] = output
-
-                    # Store in context
-                    self.context["last_command"] = command
-                    self.context["last_output"] = output
-
-                    # Add to history
-                    self.command_history.append({
-                        "timestamp": datetime.now().isoformat(),
-                        "switch": switch.hostname,
-                        "command": command,
-                        "output": output[:500] + "..." if len(output) > 500 else output
-                    })
+                    executed = self._run_one(client, command, results)
+                    self._record_history(switch, executed, results.get(executed, ""))
 
         finally:
             client.close()
 
         return results
 
-    def analyze_command_output(self, natural_input: str, commands: List[str], results: Dict, switch: NexusSwitch) -> str:
-        """Use AI to analyze command output and provide insights"""
+    async def _execute_commands_async(self, commands: List[str], switch: NexusSwitch) -> Dict:
+        """Run execute_commands_on_switch without blocking the event loop
+
+        The blocking call moves to the default executor in one piece rather
+        than as per-command tasks: the commands already travel pipelined over
+        a single shell channel, and the correction flow prompts the user
+        mid-run, so per-command fan-out would serialize on the same channel
+        anyway while breaking prompt ordering.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.execute_commands_on_switch, commands, switch
+        )
+
+    async def execute_commands_on_all_switches(self, commands: List[str]) -> Dict:
+        """Execute show commands on every configured switch concurrently
+
+        Fans out at both levels with asyncio.gather: all switches run in
+        parallel, and on each switch the commands run as concurrent asyncssh
+        sessions multiplexed over one connection. Total wall time is roughly
+        the single slowest command anywhere rather than the sum. Results are
+        keyed "hostname: command" to stay compatible with the per-switch
+        results dict shape.
+        """
+        async def run_switch(switch: NexusSwitch) -> Dict:
+            outputs = {}
+
+            # Open the connection once up front so concurrent commands share
+            # it instead of racing to dial the same switch
+            try:
+                if (switch.ip, switch.ssh_port, switch.username) not in _ASYNC_SSH_POOL:
+                    await _async_ssh_connect(switch)
+            except Exception as e:
+                outputs[switch.hostname] = f"Execution failed: {e}"
+                return outputs
+
+            gathered = await asyncio.gather(
+                *(_exec_show_async(switch, command) for command in commands),
+                return_exceptions=True
+            )
+            for command, output in zip(commands, gathered):
+                if isinstance(output, Exception):
+                    output = f"Execution failed: {output}"
+                outputs[f"{switch.hostname}: {command}"] = output
+            return outputs
+
+        results = {}
+        for outputs in await asyncio.gather(*(run_switch(sw) for sw in self.switches)):
+            results.update(outputs)
+
+        return results
+
+    def analyze_command_output(self, natural_input: str, commands: List[str], results: Dict, switch: NexusSwitch) -> Iterator[str]:
+        """Use AI to analyze command output, streaming insight text as it arrives"""
+
+        # Deterministic cache: the same question about the same device state
+        # (volatile counters masked) reuses the earlier analysis instead of
+        # paying a multi-second LLM call
+        model_name = self.ai_manager.current_model or ""
+        analysis_key = hashlib.sha256(json.dumps({
+            "model": model_name,
+            "input": natural_input,
+            "commands": sorted(commands),
+            "results": {cmd: _canonicalize_switch_output(cmd, out) for cmd, out in results.items()},
+        }, sort_keys=True).encode()).hexdigest()
+
+        cached = self._analysis_cache.get(analysis_key)
+        if cached is not None and time.time() - cached[1] <= _ANALYSIS_CACHE_TTL:
+            self._analysis_cache.move_to_end(analysis_key)
+            return iter([cached[0]])
 
         def parse_vlan_output(raw_output: str) -> List[Dict[str, str]]:
             """Parses the `show vlan` CLI output into a structured list"""
-            vlan_data = []
-            collecting = False
-
-            for line in raw_output.splitlines():
-                if re.match(r"^\s*----", line):
-                    collecting = True
-                    continue
-                if not collecting or not line.strip():
-                    continue
+            # Rows start after the dashed header separator; one multiline
+            # pass picks up each row together with its continuation lines
+            start = raw_output.find("----")
+            if start == -1:
+                return []
 
-                # Match VLAN entry: ID, Name, Status, Ports (first line)
-                match = re.match(r"^\s*(\d+)\s+(\S+)\s+(active|suspended|act/lshut|inactive)?\s*(.*)", line)
-                if match:
-                    vlan_id, name, status, ports = match.groups()
-                    vlan_data.append({
-                        "vlan_id": vlan_id,
-                        "name": name,
-                        "status": status,
-                        "ports": ports.strip()
-                    })
-                elif vlan_data and line.strip().startswith("Eth"):
-                    vlan_data[-1]["ports"] += ", " + line.strip()
+            vlan_data = []
+            for match in _RE_VLAN_MULTI.finditer(raw_output, start):
+                vlan_id, name, status, ports, continuations = match.groups()
+                ports = ports.strip()
+                if continuations:
+                    extra = [line.strip() for line in continuations.splitlines() if line.strip()]
+                    ports = ", ".join(([ports] if ports else []) + extra)
+                vlan_data.append({
+                    "vlan_id": vlan_id,
+                    "name": name,
+                    "status": status,
+                    "ports": ports
+                })
 
             return vlan_data
 
         def find_interface_vlan(vlan_data: List[Dict], interface_name: str) -> Optional[Dict]:
-            """Find which VLAN contains the specified interface"""
-            # Normalize interface name (e1/7 -> ethernet1/7, Eth1/7 -> ethernet1/7)
-            normalized_interface = interface_name.lower()
-            if normalized_interface.startswith('e1/'):
-                normalized_interface = normalized_interface.replace('e1/', 'ethernet1/')
-            elif normalized_interface.startswith('eth1/'):
-                normalized_interface = normalized_interface.replace('eth1/', 'ethernet1/')
+            """Find which VLAN contains the specified interface
 
+            Indexes each port to its VLAN once, then looks the target up
+            exactly. Unlike a substring scan this cannot confuse interfaces
+            that prefix each other (eth1/1 vs eth1/10).
+            """
+            port_index = {}
             for vlan in vlan_data:
-                ports = vlan.get('ports', '').lower()
-                if normalized_interface in ports or interface_name.lower() in ports:
-                    return vlan
-            return None
+                for port in vlan.get('ports', '').split(','):
+                    if port.strip():
+                        port_index[_normalize_interface(port)] = vlan
+
+            return port_index.get(_normalize_interface(interface_name))
 
         # Prepare outputs for analysis
         analysis_data = {}
-        vlan_summary_lines = []
+        summary_vlans = []
         interface_vlan_assignment = None
 
         for cmd, output in results.items():
-            limited_output = output[:2000] + "..." if len(output) > 2000 else output
-            analysis_data[cmd] = limited_output
+            analysis_data[cmd] = _truncate(_canonicalize_switch_output(cmd, output), 2000)
 
             # Parse and extract VLAN summary if applicable
             if "show vlan" in cmd.lower():
                 vlans = parse_vlan_output(output)
-                vlan_summary_lines = [
-                    f"VLAN {v['vlan_id']} ({v['name']}) - {v['status']} - Ports: {v['ports'] or 'None'}"
-                    for v in vlans
-                ]
+                summary_vlans = vlans
 
                 # If this is a query about interface VLAN assignment, find it specifically
                 if any(keyword in natural_input.lower() for keyword in ['which vlan', 'what vlan', 'vlan assignment', 'assigned to']):
                     # Extract interface name from the query
-                    interface_match = re.search(r'e\d+/\d+|ethernet\d+/\d+', natural_input.lower())
+                    interface_match = _RE_IFACE.search(natural_input.lower())
                     if interface_match:
                         interface_name = interface_match.group()
                         interface_vlan_assignment = find_interface_vlan(vlans, interface_name)
 
         vlan_summary_text = ""
-        if vlan_summary_lines:
-            vlan_summary_text = "Detected VLANs:\n" + "\n".join(vlan_summary_lines)
+        if summary_vlans:
+            # Feed the join a generator; no intermediate line list
+            vlan_summary_text = "Detected VLANs:\n" + "\n".join(
+                f"VLAN {v['vlan_id']} ({v['name']}) - {v['status']} - Ports: {v['ports'] or 'None'}"
+                for v in summary_vlans
+            )
 
         # Create a specific analysis prompt based on the query type
         if interface_vlan_assignment:
             specific_finding = f"\nSPECIFIC FINDING: Interface {interface_match.group()} is assigned to VLAN {interface_vlan_assignment['vlan_id']} ({interface_vlan_assignment['name']}) - Status: {interface_vlan_assignment['status']}"
         elif any(keyword in natural_input.lower() for keyword in ['which vlan', 'what vlan', 'vlan assignment', 'assigned to']):
-            interface_match = re.search(r'e\d+/\d+|ethernet\d+/\d+', natural_input.lower())
+            interface_match = _RE_IFACE.search(natural_input.lower())
             if interface_match:
                 specific_finding = f"\nSPECIFIC FINDING: Interface {interface_match.group()} was NOT found in any VLAN assignment. This interface may not be configured as an access port or may be a trunk port."
             else:
@@ -1094,49 +1906,87 @@ REMEMBER: Return ONLY CLI commands, no markdown, no explanations, no code blocks
         else:
             specific_finding = ""
 
-        analysis_prompt = f"""Analyze the output from these Nexus CLI commands and provide insights based on the user's request.
+        # Markdown sections instead of json.dumps: no escaping of every
+        # newline/quote in the outputs, fewer tokens, and fenced blocks are
+        # friendlier to the model than one giant JSON string
+        outputs_md = "\n".join(
+            f"### {cmd}\n```\n{out}\n```" for cmd, out in analysis_data.items()
+        )
 
-User Request: "{natural_input}"
+        analysis_prompt = f"""User Request: "{natural_input}"
 Switch: {switch.hostname} ({switch.ip})
 Commands Executed: {', '.join(commands)}
 
 Command Outputs:
-{json.dumps(analysis_data, indent=2)}
+{outputs_md}
 
 {vlan_summary_text}
 {specific_finding}
+"""
 
-Provide a comprehensive analysis including:
-1. Direct answer to the user's question
-2. Key findings and observations
-3. Any issues or concerns identified
-4. Recommended next steps or actions
-5. Additional commands that might be helpful
+        def stream_analysis() -> Iterator[str]:
+            """Yield analysis text chunk by chunk so rendering can overlap I/O"""
+            from langchain_core.messages import HumanMessage
 
-Format the response clearly with emojis and sections for better readability.
-Keep the analysis practical and actionable for network operations.
-Focus on what matters most for network health and troubleshooting.
+            try:
+                llm = self.ai_manager.get_current_model()
+                if not llm:
+                    yield "Analysis failed: No AI model available"
+                    return
+
+                # When this input was just translated by the LLM, continue
+                # that conversation: its system prompt and user turn sit in
+                # the provider's prefix cache from seconds ago, so the
+                # analysis call reuses them instead of a cold prompt
+                last = self._last_translation
+                if last and last[0] == natural_input:
+                    from langchain_core.messages import AIMessage
+                    messages = [
+                        self._system_message(_NEXUS_SYSTEM_PROMPT),
+                        HumanMessage(content=last[1]),
+                        AIMessage(content=last[2]),
+                        HumanMessage(content=f"{_ANALYSIS_SYSTEM_PROMPT}\n\n{analysis_prompt}")
+                    ]
+                else:
+                    messages = [
+                        self._system_message(_ANALYSIS_SYSTEM_PROMPT),
+                        HumanMessage(content=analysis_prompt)
+                    ]
 
-If there are any problems found, prioritize those in your analysis.
-If everything looks good, highlight the positive status clearly.
+                try:
+                    for chunk in llm.stream(messages):
+                        text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+                        if text:
+                            yield text
+                except NotImplementedError:
+                    # Driver without streaming support: fall back to one shot
+                    yield llm.invoke(messages).content
 
-IMPORTANT: If this was a query about VLAN assignment for a specific interface, make sure to directly answer which VLAN the interface is assigned to based on the show vlan brief output.
-"""
+            except Exception as e:
+                yield f"Analysis failed: {e}\n\nRaw command outputs:\n" + \
+                      "\n".join([f"{cmd}:\n{output}\n" for cmd, output in results.items()])
 
-        try:
-            llm = self.ai_manager.get_current_model()
-            if not llm:
-                return "Analysis failed: No AI model available"
+        def cached_stream() -> Iterator[str]:
+            """Pass chunks through, storing the full text on clean completion"""
+            parts = []
+            for chunk in stream_analysis():
+                parts.append(chunk)
+                yield chunk
 
-            response = llm.invoke([HumanMessage(content=analysis_prompt)])
-            return response.content
+            analysis_text = "".join(parts)
+            if not analysis_text.startswith("Analysis failed"):
+                self._analysis_cache[analysis_key] = (analysis_text, time.time())
+                while len(self._analysis_cache) > _ANALYSIS_CACHE_MAX:
+                    self._analysis_cache.popitem(last=False)
 
-        except Exception as e:
-            return f"Analysis failed: {e}\n\nRaw command outputs:\n" + \
-                   "\n".join([f"{cmd}:\n{output}\n" for cmd, output in results.items()])
+        return cached_stream()
 
-    def display_results(self, natural_input: str, commands: List[str], results: Dict, analysis: str, switch: NexusSwitch):
-        """Display results in a formatted way"""
+    def display_results(self, natural_input: str, commands: List[str], results: Dict, analysis, switch: NexusSwitch) -> str:
+        """Display results in a formatted way, rendering analysis as it streams
+
+        analysis may be a plain string or an iterator of text chunks; the
+        fully accumulated analysis text is returned either way.
+        """
 
         # Command execution summary
         self.console.print(Panel.fit(
@@ -1148,11 +1998,16 @@ IMPORTANT: If this was a query about VLAN assignment for a specific interface, m
         if self.show_raw:
             # In batch mode with show_raw=true, automatically show raw outputs
             show_raw_outputs = True
+        elif self.auto_confirm:
+            # --yes suppresses the prompt and takes its default
+            show_raw_outputs = False
         else:
             # In interactive mode or batch mode with show_raw=false, ask user
             show_raw_outputs = Confirm.ask("Show raw command outputs?", default=False)
 
         if show_raw_outputs:
+            from rich.syntax import Syntax
+
             for command, output in results.items():
                 self.console.print(f"\n[bold blue]Command:[/bold blue] {command}")
 
@@ -1163,14 +2018,20 @@ IMPORTANT: If this was a query about VLAN assignment for a specific interface, m
                 else:
                     self.console.print(Panel(output, title="Output", border_style="blue"))
 
-        # AI Analysis - Main focus
+        # AI Analysis - Main focus, redrawn live as chunks arrive
         current_model_info = self.ai_manager.get_current_model_info()
-        self.console.print(Panel(
-            analysis,
-            title=f"🤖 AI Analysis ({current_model_info['provider']}) for: '{natural_input}'",
-            border_style="cyan",
-            expand=False
-        ))
+        title = f"🤖 AI Analysis ({current_model_info['provider']}) for: '{natural_input}'"
+
+        from rich.markdown import Markdown
+
+        chunks = [analysis] if isinstance(analysis, str) else analysis
+        buf = ""
+        with Live(console=self.console, refresh_per_second=8) as live:
+            for chunk in chunks:
+                buf += chunk
+                live.update(Panel(Markdown(buf), title=title, border_style="cyan", expand=False))
+
+        return buf
 
     def show_command_history(self):
         """Display recent command history"""
@@ -1185,7 +2046,7 @@ IMPORTANT: If this was a query about VLAN assignment for a specific interface, m
         table.add_column("Status", style="yellow")
 
         for entry in self.command_history[-10:]:  # Last 10 commands
-            timestamp = datetime.fromisoformat(entry["timestamp"]).strftime("%H:%M:%S")
+            timestamp = time.strftime("%H:%M:%S", time.localtime(entry["ts"]))
             status = "✅ Success" if not entry["output"].startswith("Error") else "❌ Error"
             table.add_row(timestamp, entry["switch"], entry["command"], status)
 
@@ -1193,6 +2054,14 @@ IMPORTANT: If this was a query about VLAN assignment for a specific interface, m
 
     def get_suggested_commands(self, context: str = "") -> List[str]:
         """Get AI-suggested commands based on context"""
+        # Identical (model, context) pairs recur whenever the user asks for
+        # suggestions twice without running a command in between
+        model_info = self.ai_manager.get_current_model_info()
+        memo_key = (model_info['name'] if model_info else None, context.strip().lower())
+        if memo_key in self._suggestion_cache:
+            self._suggestion_cache.move_to_end(memo_key)
+            return list(self._suggestion_cache[memo_key])
+
         suggestion_prompt = f"""Based on the current context of a Nexus switch troubleshooting session, suggest 5 useful natural language commands that a network engineer might want to run next.
 
 Context: {context or "Starting troubleshooting session"}
@@ -1217,9 +2086,15 @@ Examples:
                     "Check EVPN neighbors"
                 ]
 
+            from langchain_core.messages import HumanMessage
             response = llm.invoke([HumanMessage(content=suggestion_prompt)])
             suggestions = [line.strip().lstrip('- ') for line in response.content.split('\n') if line.strip()]
-            return suggestions[:5]
+            suggestions = suggestions[:5]
+
+            self._suggestion_cache[memo_key] = suggestions
+            while len(self._suggestion_cache) > 64:
+                self._suggestion_cache.popitem(last=False)
+            return list(suggestions)
         except:
             return [
                 "Check interface status",
@@ -1324,59 +2199,23 @@ Tips:
         for command in commands:
             command_lower = command.lower().strip()
 
-            # Skip all show commands - they are read-only
-            if command_lower.startswith('show '):
+            # Skip show/display/monitoring commands - they are read-only
+            if command_lower.startswith(_READONLY_PREFIXES):
                 continue
 
-            # Skip display/monitoring commands
-            if any(command_lower.startswith(prefix) for prefix in ['show', 'display', 'ping', 'traceroute', 'telnet', 'ssh']):
-                continue
-
-            # Check for actual configuration keywords
-            config_keywords = [
-                'configure terminal',
-                'interface ethernet',  # More specific to avoid false positives
-                'interface vlan',
-                'interface loopback',
-                'interface port-channel',
-                'router bgp',
-                'vlan ',
-                'snmp-server',
-                'feature ',
-                'vpc ',
-                'no shutdown',
-                'shutdown',
-                'description ',
-                'ip address',
-                'switchport',
-                'neighbor ',
-                'address-family',
-                'route-map',
-                'access-list',
-                'ip route',
-                'hostname',
-                'username',
-                'enable secret',
-                'line vty',
-                'copy running',
-                'write memory',
-                'default interface', # delete all the configuration under an interface
-                'no ',  # Any 'no' command is typically configuration
-            ]
-
-            # Only flag as config if it matches keywords AND doesn't start with show
-            if any(keyword in command_lower for keyword in config_keywords):
+            # One compiled alternation instead of ~30 substring scans
+            if _CFG_COMMAND_RE.search(command_lower):
                 return True
 
         return False
 
     def show_configuration_warning(self, commands: List[str]) -> bool:
         """Show warning for configuration commands and get confirmation"""
-        # If show_raw is enabled (batch mode), automatically confirm configuration commands
-        if self.show_raw:
+        # show_raw (batch mode) and --yes both auto-confirm configuration commands
+        if self.show_raw or self.auto_confirm:
             self.console.print("\n[bold yellow]⚠️  CONFIGURATION COMMANDS DETECTED - Auto-confirming in batch mode[/bold yellow]")
             for i, command in enumerate(commands, 1):
-                if any(keyword in command.lower() for keyword in ['configure', 'interface', 'router', 'vlan', 'snmp-server']):
+                if _RE_CONFIG_HILITE.search(command.lower()):
                     self.console.print(f"  [red]{i}. {command}[/red]")
                 else:
                     self.console.print(f"  [dim]{i}. {command}[/dim]")
@@ -1386,7 +2225,7 @@ Tips:
         self.console.print("[yellow]The following commands will modify the switch configuration:[/yellow]")
 
         for i, command in enumerate(commands, 1):
-            if any(keyword in command.lower() for keyword in ['configure', 'interface', 'router', 'vlan', 'snmp-server']):
+            if _RE_CONFIG_HILITE.search(command.lower()):
                 self.console.print(f"  [red]{i}. {command}[/red]")
             else:
                 self.console.print(f"  [dim]{i}. {command}[/dim]")
@@ -1410,8 +2249,11 @@ Tips:
                     self.console.print(f"  • {model}")
                 return
 
-        # Select switch
-        if switch_name:
+        # Select switch ("all" fans show commands out to the whole fleet)
+        fan_out = switch_name is not None and switch_name.lower() in ("all", "*")
+        if fan_out:
+            target_switch = NexusSwitch(hostname="all-switches", ip="*", username="", password="")
+        elif switch_name:
             target_switch = None
             for switch in self.switches:
                 if switch_name.lower() in [switch.hostname.lower(), switch.ip]:
@@ -1450,33 +2292,52 @@ Tips:
 
         # Check if any commands are configuration commands
         if self.is_configuration_command(commands):
+            if fan_out:
+                self.console.print("[red]❌ Configuration commands cannot be fanned out to all switches[/red]")
+                return
             if not self.show_configuration_warning(commands):
                 self.console.print("[yellow]Configuration changes cancelled.[/yellow]")
                 return
 
-        results = self.execute_commands_on_switch(commands, target_switch)
-        if "error" in results:
-            self.console.print(f"[red]❌ {results['error']}[/red]")
-            return
+        try:
+            if fan_out:
+                results = await self.execute_commands_on_all_switches(commands)
+            else:
+                results = self.execute_commands_on_switch(commands, target_switch)
+            if "error" in results:
+                self.console.print(f"[red]❌ {results['error']}[/red]")
+                return
 
-        analysis = self.analyze_command_output(command, commands, results, target_switch)
+            analysis_stream = self.analyze_command_output(command, commands, results, target_switch)
 
-        # Display results
-        self.display_results(command, commands, results, analysis, target_switch)
+            # Display results, accumulating the streamed analysis for the report
+            analysis = self.display_results(command, commands, results, analysis_stream, target_switch)
 
-        # Save to file if requested
-        if output_file:
-            report = self.generate_report(command, commands, results, analysis, target_switch)
-            with open(output_file, 'w') as f:
-                f.write(report)
-            self.console.print(f"[green]💾 Report saved to {output_file}[/green]")
+            # Save to file if requested; a .gz suffix compresses the report,
+            # which shrinks the highly redundant raw outputs several-fold
+            if output_file:
+                report = self.generate_report(command, commands, results, analysis, target_switch)
+                if output_file.endswith('.gz'):
+                    import gzip
+                    with gzip.open(output_file, 'wt') as f:
+                        f.write(report)
+                else:
+                    with open(output_file, 'w') as f:
+                        f.write(report)
+                self.console.print(f"[green]💾 Report saved to {output_file}[/green]")
+        finally:
+            # Drain the asyncssh pool while the loop is still running
+            if fan_out:
+                await _close_async_ssh_pool()
 
     def generate_report(self, natural_input: str, commands: List[str], results: Dict, analysis: str, switch: NexusSwitch) -> str:
         """Generate a text report"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         current_model_info = self.ai_manager.get_current_model_info()
 
-        report = f"""# Nexus CLI Analysis Report
+        # Collect parts and join once; += on a growing report string is
+        # quadratic in the number of command outputs
+        parts = [f"""# Nexus CLI Analysis Report
 **Generated:** {timestamp}
 **Switch:** {switch.hostname} ({switch.ip})
 **User Request:** {natural_input}
@@ -1489,22 +2350,53 @@ Tips:
 {analysis}
 
 ## Raw Command Outputs
-"""
+"""]
 
         for command, output in results.items():
-            report += f"""
+            parts.append(f"""
 ### {command}
 ```
 {output}
 ```
-"""
+""")
 
-        report += """
+        parts.append("""
 ---
 *Generated by Interactive Nexus CLI Tool with Multi-AI Support*
-"""
+""")
+
+        return "".join(parts)
+
+    async def _read_interactive_input(self) -> str:
+        """Read one REPL line through a persistent prompt session
+
+        A single prompt_toolkit PromptSession amortizes renderer setup
+        across turns and adds in-memory history plus word completion seeded
+        from the builtin commands. History is kept in memory only. Falls
+        back to Prompt.ask when prompt_toolkit is not installed.
+        """
+        if self._session is None and not self._no_prompt_toolkit:
+            try:
+                from prompt_toolkit import PromptSession
+                from prompt_toolkit.completion import WordCompleter
+                from prompt_toolkit.history import InMemoryHistory
+
+                completer = WordCompleter(
+                    list(self._builtin_cmds) + ['exit', 'quit', 'show ', 'interface ', 'vlan '],
+                    ignore_case=True
+                )
+                self._session = PromptSession(history=InMemoryHistory(), completer=completer)
+            except ImportError:
+                self._no_prompt_toolkit = True
+
+        if self._session is not None:
+            line = await self._session.prompt_async(f"{self.current_switch.hostname}> ")
+            return line.strip()
 
-        return report
+        return Prompt.ask(
+            f"[bold blue]{self.current_switch.hostname}>[/bold blue]",
+            default=""
+        ).strip()
 
     async def interactive_loop(self):
         """Main interactive loop"""
@@ -1514,7 +2406,7 @@ Tips:
         if not self.current_switch:
             return
 
-        current_model_info = self.ai_manager.get_current_model_info()
+        current_model_info = self._current_model_info()
         self.console.print(f"\n[green]🚀 Ready! Connected to {self.current_switch.hostname}[/green]")
         self.console.print(f"[blue]🤖 AI Model: {current_model_info['description']} ({current_model_info['provider']})[/blue]")
         self.console.print("[dim]Type 'help' for usage information or start with natural language commands[/dim]")
@@ -1525,44 +2417,24 @@ Tips:
         while True:
             try:
                 # Get user input
-                user_input = Prompt.ask(
-                    f"[bold blue]{self.current_switch.hostname}>[/bold blue]",
-                    default=""
-                ).strip()
+                user_input = await self._read_interactive_input()
 
                 if not user_input:
                     continue
 
-                # Handle special commands
-                if user_input.lower() in ['exit', 'quit', 'q']:
+                # Handle special commands via dict dispatch
+                lowered = user_input.lower()
+                if lowered in ('exit', 'quit', 'q'):
                     self.console.print("[green]👋 Goodbye![/green]")
                     break
-                elif user_input.lower() == 'help':
-                    self.show_help()
-                    continue
-                elif user_input.lower() in ['models', 'model']:
-                    self.select_model()
-                    continue
-                elif user_input.lower() == 'switches':
-                    self.show_available_switches()
-                    continue
-                elif user_input.lower() == 'switch':
-                    new_switch = self.select_switch()
-                    if new_switch:
-                        self.current_switch = new_switch
-                    continue
-                elif user_input.lower() == 'history':
-                    self.show_command_history()
-                    continue
-                elif user_input.lower() in ['suggestions', 'suggest', 'ideas']:
-                    self.show_suggestions()
-                    continue
-                elif user_input.lower() == 'clear':
-                    os.system('clear' if os.name == 'posix' else 'cls')
+
+                builtin = self._builtin_cmds.get(lowered)
+                if builtin:
+                    builtin()
                     continue
 
                 # Process natural language command
-                current_model_info = self.ai_manager.get_current_model_info()
+                current_model_info = self._current_model_info()
                 self.console.print(f"[dim]🧠 Translating with {current_model_info['provider']}: '{user_input}'...[/dim]")
 
                 # Translate to CLI commands
@@ -1580,9 +2452,9 @@ Tips:
                         continue
 
                 # Confirm execution - skip in batch mode with show_raw
-                if self.show_raw or Confirm.ask(f"Execute {len(commands)} command(s)?", default=True):
+                if self.show_raw or self.auto_confirm or Confirm.ask(f"Execute {len(commands)} command(s)?", default=True):
                     # Execute commands
-                    results = self.execute_commands_on_switch(commands, self.current_switch)
+                    results = await self._execute_commands_async(commands, self.current_switch)
 
                     if "error" in results:
                         self.console.print(f"[red]❌ {results['error']}[/red]")
@@ -1590,20 +2462,27 @@ Tips:
 
                     # Analyze results
                     self.console.print(f"[dim]🤖 Analyzing results with {current_model_info['provider']}...[/dim]")
-                    analysis = self.analyze_command_output(user_input, commands, results, self.current_switch)
-
-                    # Display results
-                    self.display_results(user_input, commands, results, analysis, self.current_switch)
-
-                    # Update context
-                    self.context["session_notes"].append({
-                        "request": user_input,
-                        "commands": commands,
-                        "key_findings": analysis[:200] + "..." if len(analysis) > 200 else analysis
-                    })
+                    analysis_stream = self.analyze_command_output(user_input, commands, results, self.current_switch)
+
+                    # Display results, accumulating the streamed analysis text
+                    analysis = self.display_results(user_input, commands, results, analysis_stream, self.current_switch)
+
+                    # Update context - pointless in one-shot batch mode, and
+                    # repeats of the same request add nothing to the notes
+                    if not self.show_raw:
+                        note_key = (user_input.strip().lower(), tuple(commands))
+                        if note_key not in self._session_note_keys:
+                            self._session_note_keys[note_key] = None
+                            while len(self._session_note_keys) > 200:
+                                self._session_note_keys.popitem(last=False)
+                            self.context["session_notes"].append({
+                                "request": user_input,
+                                "commands": commands,
+                                "key_findings": textwrap.shorten(analysis, width=200, placeholder="...")
+                            })
 
                     # Show suggestions for next steps - skip in batch mode
-                    if not self.show_raw and Confirm.ask("Show suggested next commands?", default=False):
+                    if not self.show_raw and not self.auto_confirm and Confirm.ask("Show suggested next commands?", default=False):
                         self.show_suggestions()
 
                     print()  # Add spacing
@@ -1617,7 +2496,7 @@ Tips:
 
 def list_available_models():
     """List all available AI models in a standalone function"""
-    console = Console()
+    console = get_console()
 
     # Create a temporary AI manager to check available models
     ai_manager = AIModelManager()
@@ -1662,12 +2541,13 @@ def install_requirements():
             os.system(f"pip install {package}")
 
 def main():
-    # Install requirements if needed
+    # uvloop's event loop is markedly faster for the asyncssh fan-out path;
+    # purely optional
     try:
-        from rich.console import Console
+        import uvloop
+        uvloop.install()
     except ImportError:
-        install_requirements()
-        from rich.console import Console
+        pass
 
     parser = argparse.ArgumentParser(description="Interactive Nexus CLI Tool with Natural Language")
     parser.add_argument("--batch", help="Execute a single natural language command and exit")
@@ -1676,9 +2556,20 @@ def main():
     parser.add_argument("--output", help="Save output to file")
     parser.add_argument("--list-models", action="store_true", help="List all available AI models and exit")
     parser.add_argument("--show-raw", help="Automatically show raw command outputs in batch mode (true/false)", default="false")
+    parser.add_argument("--install-deps", action="store_true", help="Install missing dependencies with pip and continue")
+    parser.add_argument("--yes", action="store_true", help="Skip confirmation prompts (auto-confirm)")
 
     args = parser.parse_args()
 
+    # Probing seven packages with __import__ is a startup tax, so dependency
+    # installation only runs when explicitly requested
+    if args.install_deps:
+        install_requirements()
+
+    # Pull API keys from .env only once we're actually starting up
+    from dotenv import load_dotenv
+    load_dotenv()
+
     # Convert show-raw argument to boolean
     show_raw = args.show_raw.lower() in ['true', '1', 'yes', 'on']
 
@@ -1688,7 +2579,7 @@ def main():
         return
 
     # Initialize CLI with specified model and show_raw flag
-    cli = NaturalLanguageNexusCLI(initial_model=args.model, show_raw=show_raw)
+    cli = NaturalLanguageNexusCLI(initial_model=args.model, show_raw=show_raw, auto_confirm=args.yes)
 
     if args.batch:
         # Batch mode - execute single command and exit